@@ -1,9 +1,12 @@
 import os
 import asyncpg
 import dotenv
+import orjson
 from loguru import logger
 from typing import Optional
 
+from ..repositories.crud import warm_statement_cache
+
 # Cargar variables de entorno desde archivo .env
 dotenv.load_dotenv()
 
@@ -11,6 +14,35 @@ dotenv.load_dotenv()
 conn_pool: Optional[asyncpg.Pool] = None
 
 
+def _encode_jsonb(value) -> str:
+    """Codifica valores Python a JSONB; las cadenas ya serializadas pasan tal cual."""
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode()
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Configura cada conexión nueva del pool.
+
+    Registra orjson como codec JSONB para que asyncpg devuelva dicts
+    directamente en lugar de cadenas que habría que decodificar en Python.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="text",
+    )
+    try:
+        await warm_statement_cache(conn)
+    except Exception as e:
+        # En el primer arranque las tablas aún no existen; la caché se
+        # llenará con el uso normal.
+        logger.debug(f"No se pudo precalentar la caché de statements: {e}")
+
+
 async def init_db():
     """
     Inicializa la conexión a PostgreSQL/TimescaleDB y configura el esquema de base de datos.
@@ -22,11 +54,21 @@ async def init_db():
     try:
         logger.info("Iniciando conexión a la base de datos PostgreSQL...")
 
-        # Crear pool de conexiones con configuración optimizada para IoT
+        # Crear pool de conexiones con configuración optimizada para IoT:
+        # - min_size precalienta conexiones antes del tráfico (TLS + auth + caché),
+        #   acotado a max_size (asyncpg rechaza min_size > max_size y os.cpu_count()
+        #   reporta los cores del host incluso en contenedores limitados)
+        # - max_inactive_connection_lifetime=0 evita reciclar conexiones ociosas
+        #   (cada reconexión paga de nuevo la preparación de statements)
+        # - statement_cache_size amplio para cubrir todos los statements del módulo
+        max_size = 20
         conn_pool = await asyncpg.create_pool(
             dsn=os.getenv("DATABASE_URL"),
-            min_size=1,
-            max_size=5,
+            min_size=min(max_size, max(4, os.cpu_count() or 1)),
+            max_size=max_size,
+            max_inactive_connection_lifetime=0,
+            statement_cache_size=1024,
+            init=_init_connection,
             server_settings={"timezone": "UTC"},
         )
         logger.info("Conexión a la base de datos PostgreSQL establecida.")
@@ -110,24 +152,56 @@ async def init_db():
                     ON device_schedules USING gist (valid_range);
                     """
                 )
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_device_schedules_device_range
+                    ON device_schedules USING gist (device_id, shift_type, valid_range);
+                    """
+                )
                 await conn.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_device_schedules_special_days
                     ON device_schedules USING GIN (special_days);
                     """
                 )
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_device_schedules_day_schedules
+                    ON device_schedules USING GIN (day_schedules);
+                    """
+                )
                 await conn.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_device_schedules_created_at
                     ON device_schedules (created_at DESC);
                     """
                 )
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_device_schedules_updated_at_brin
+                    ON device_schedules USING brin (updated_at) WITH (pages_per_range = 32);
+                    """
+                )
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_device_schedules_open_ended
+                    ON device_schedules (device_id, shift_type)
+                    WHERE valid_to IS NULL;
+                    """
+                )
                 await conn.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_device_schedules_shift_type
                     ON device_schedules (device_id, shift_type);
                     """
                 )
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_device_schedules_metadata_cover
+                    ON device_schedules (device_id, shift_type)
+                    INCLUDE (id, valid_range, valid_from, valid_to, version, source, created_at, updated_at);
+                    """
+                )
                 logger.info("Índices de 'device_schedules' creados correctamente.")
 
                 # Migrate data from old schedules table if it exists
@@ -5,11 +5,15 @@ This module initializes the FastAPI application with proper middleware,
 database connections, and routing configuration.
 """
 
+import hmac
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 
+from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.middleware import LoggingMiddleware
 from app.core.postgres import init_db, close_postgres
@@ -55,6 +59,60 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Auth runs once per request as middleware instead of a Depends on every
+# route, skipping the dependency solver on the hot path. Health checks and
+# the public docs endpoints stay open, as before.
+_AUTH_EXEMPT_PATHS = frozenset({
+    "/shifts-api",
+    "/shifts-api/health",
+    "/shifts-api/v1/schedules/docs",
+    "/shifts-api/v1/schedules/redoc",
+    "/shifts-api/v1/schedules/openapi.json",
+})
+
+
+@app.middleware("http")
+async def api_key_middleware(request: Request, call_next):
+    if request.url.path in _AUTH_EXEMPT_PATHS:
+        return await call_next(request)
+    if not settings.API_KEY:
+        return JSONResponse(
+            status_code=500,
+            content={"detail": "API key no configurada en el servidor"},
+        )
+    # compare_digest: comparación en tiempo constante para no filtrar por
+    # timing cuántos caracteres del API key coinciden.
+    if not hmac.compare_digest(request.headers.get("x-api-key", ""), settings.API_KEY):
+        return JSONResponse(
+            status_code=401,
+            content={"detail": "API key inválida"},
+            headers={"WWW-Authenticate": "ApiKey"},
+        )
+    return await call_next(request)
+
+
+# Domain exceptions raised by the service layer are translated centrally
+# instead of per-route try/except blocks: ValueError → 400, LookupError → 404.
+
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(LookupError)
+async def lookup_error_handler(request: Request, exc: LookupError):
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception(f"Error no controlado en {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=500, content={"detail": "Error interno del servidor"}
+    )
+
+
 # Add logging middleware
 app.add_middleware(LoggingMiddleware)
 
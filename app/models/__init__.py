@@ -9,6 +9,7 @@ from .schedule import (
     Break,
     ExtraHour,
     DaySchedule,
+    EffectiveSchedule,
     Schedule,
     ScheduleEntity,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "Break",
     "ExtraHour",
     "DaySchedule",
+    "EffectiveSchedule",
     "Schedule",
     "ScheduleEntity",
 ]
\ No newline at end of file
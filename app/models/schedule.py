@@ -5,11 +5,11 @@ These models represent the core business entities and logic,
 separate from API serialization concerns.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from pydantic_core.core_schema import ValidationInfo
-from typing import List, Optional, Dict, ClassVar
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, NamedTuple, Optional, Dict, ClassVar
 from datetime import datetime, timedelta, date as date_type
 from enum import Enum
+from functools import cached_property
 import re
 
 
@@ -19,6 +19,17 @@ _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 _INVALID_TIME_MSG = "Time must be in HH:MM format"
 
+_VALID_DAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+_WEEKDAY_INDEX = {day: i for i, day in enumerate(_VALID_DAYS)}
+
 
 def _parse_hhmm(value: str) -> datetime:
     """Parse 'HH:MM' to a datetime (today's date)."""
@@ -94,6 +105,8 @@ class WorkHours(BaseModel):
     Handles validation and business logic for regular work hours.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     start: str = Field(..., description="Start time in HH:MM format")
     end: str = Field(..., description="End time in HH:MM format")
 
@@ -105,14 +118,12 @@ class WorkHours(BaseModel):
             raise ValueError(_INVALID_TIME_MSG)
         return v
 
-    @field_validator("end")
-    @classmethod
-    def end_not_equal_start(cls, v: str, info: ValidationInfo) -> str:
+    @model_validator(mode="after")
+    def end_not_equal_start(self) -> "WorkHours":
         """Ensure end time is not equal to start time."""
-        start = info.data.get("start")
-        if start and v == start:
+        if self.end == self.start:
             raise ValueError("End time must differ from start time")
-        return v
+        return self
 
     def crosses_midnight(self) -> bool:
         """Check if work hours cross midnight (e.g. 22:00→06:00)."""
@@ -137,6 +148,8 @@ class Break(BaseModel):
     Handles validation and business logic for work breaks.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     start: str = Field(..., description="Break start time in HH:MM format")
     duration_minutes: int = Field(..., description="Break duration in minutes")
 
@@ -170,6 +183,8 @@ class ExtraHour(BaseModel):
     Represents additional work periods beyond regular hours.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     start: str = Field(..., description="Extra hour start time in HH:MM format")
     end: str = Field(..., description="Extra hour end time in HH:MM format")
 
@@ -181,14 +196,12 @@ class ExtraHour(BaseModel):
             raise ValueError(_INVALID_TIME_MSG)
         return v
 
-    @field_validator("end")
-    @classmethod
-    def end_not_equal_start(cls, v: str, info: ValidationInfo) -> str:
+    @model_validator(mode="after")
+    def end_not_equal_start(self) -> "ExtraHour":
         """Ensure end time is not equal to start time."""
-        start = info.data.get("start")
-        if start and v == start:
+        if self.end == self.start:
             raise ValueError("End time must differ from start time")
-        return v
+        return self
 
     def duration_minutes(self) -> int:
         """Calculate extra hour duration in minutes (handles cross-midnight)."""
@@ -207,19 +220,17 @@ class DaySchedule(BaseModel):
     Represents work hours and break configuration for one specific day.
     """
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     work_hours: WorkHours = Field(..., description="Work hours for this day")
     breaks: Optional[List[Break]] = Field(None, description="Break configurations for this day")
 
-    @field_validator("breaks")
-    @classmethod
-    def validate_breaks(cls, v: Optional[List[Break]], info: ValidationInfo) -> Optional[List[Break]]:
+    @model_validator(mode="after")
+    def validate_breaks(self) -> "DaySchedule":
         """Ensure all breaks are within work hours and don't overlap."""
-        if not v:
-            return v
-        work_hours: WorkHours = info.data.get("work_hours")
-        if work_hours:
-            _validate_breaks_within_work_hours(v, work_hours)
-        return v
+        if self.breaks:
+            _validate_breaks_within_work_hours(self.breaks, self.work_hours)
+        return self
 
     def total_work_minutes(self) -> int:
         """Calculate total work minutes excluding breaks."""
@@ -229,6 +240,17 @@ class DaySchedule(BaseModel):
         return total
 
 
+class EffectiveSchedule(NamedTuple):
+    """Lightweight (work_hours, breaks) pair resolved for a specific date.
+
+    Avoids rebuilding validated DaySchedule/Break instances just to hand
+    already-validated values back to the caller.
+    """
+
+    work_hours: WorkHours
+    breaks: Optional[List[Break]]
+
+
 class SpecialDay(BaseModel):
     """
     Business model for special day configuration.
@@ -237,6 +259,8 @@ class SpecialDay(BaseModel):
     regular weekday schedules on specific dates.
     """
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     name: str = Field(..., min_length=1, max_length=100, description="Name of the special day")
     type: SpecialDayType = Field(..., description="Type of special day")
     work_hours: Optional[WorkHours] = Field(
@@ -256,30 +280,24 @@ class SpecialDay(BaseModel):
         description="Recurrence pattern if recurring"
     )
 
-    @field_validator("breaks")
-    @classmethod
-    def validate_breaks_require_work_hours(cls, v: Optional[List[Break]], info: ValidationInfo) -> Optional[List[Break]]:
+    @model_validator(mode="after")
+    def validate_breaks_require_work_hours(self) -> "SpecialDay":
         """Breaks require work_hours to be set."""
-        if not v:
-            return v
-        work_hours = info.data.get("work_hours")
-        if not work_hours:
-            raise ValueError("Breaks cannot be set without work hours")
-        _validate_breaks_within_work_hours(v, work_hours)
-        return v
+        if self.breaks:
+            if not self.work_hours:
+                raise ValueError("Breaks cannot be set without work hours")
+            _validate_breaks_within_work_hours(self.breaks, self.work_hours)
+        return self
 
-    @field_validator("recurrence_pattern")
-    @classmethod
-    def validate_recurrence_pattern(cls, v: Optional[RecurrencePattern], info: ValidationInfo) -> Optional[RecurrencePattern]:
+    @model_validator(mode="after")
+    def validate_recurrence_pattern(self) -> "SpecialDay":
         """Validate recurrence pattern consistency with is_recurring."""
-        is_recurring = info.data.get("is_recurring")
-
-        if v and v != RecurrencePattern.NONE and not is_recurring:
+        pattern = self.recurrence_pattern
+        if pattern and pattern != RecurrencePattern.NONE and not self.is_recurring:
             raise ValueError("recurrence_pattern requires is_recurring=True")
-        if is_recurring and not v:
+        if self.is_recurring and not pattern:
             raise ValueError("is_recurring=True requires recurrence_pattern to be set")
-
-        return v
+        return self
 
     def total_work_minutes(self) -> int:
         """Calculate total work minutes for this special day (excluding breaks)."""
@@ -301,15 +319,10 @@ class Schedule(BaseModel):
     for validation and calculations. Each day can have different work hours.
     """
 
-    VALID_DAYS: ClassVar[List[str]] = [
-        "monday",
-        "tuesday",
-        "wednesday",
-        "thursday",
-        "friday",
-        "saturday",
-        "sunday",
-    ]
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
+    VALID_DAYS: ClassVar[List[str]] = _VALID_DAYS
+    VALID_DAYS_SET: ClassVar[frozenset] = frozenset(_VALID_DAYS)
 
     day_schedules: Dict[str, DaySchedule] = Field(
         ..., description="Schedule configuration for each active day"
@@ -348,9 +361,15 @@ class Schedule(BaseModel):
             return self.day_schedules[first_day].total_work_minutes()
         return 0
 
+    @cached_property
+    def _active_mask(self) -> int:
+        """Bitmask of active days, one bit per weekday (bit 0 = monday)."""
+        return sum(1 << _WEEKDAY_INDEX[day] for day in self.day_schedules)
+
     def is_work_day(self, day: str) -> bool:
         """Check if a given day is a work day."""
-        return day.lower() in self.day_schedules
+        idx = _WEEKDAY_INDEX.get(day.lower())
+        return idx is not None and self._active_mask >> idx & 1 == 1
 
 
 class ScheduleEntity(BaseModel):
@@ -361,6 +380,8 @@ class ScheduleEntity(BaseModel):
     Supports N schedules per device with valid_from/valid_to date ranges.
     """
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     id: Optional[int] = None
     device_id: int = Field(..., description="Device identifier (FK to devices table)")
     shift_type: str = Field(default="day", description="Shift type label (e.g. 'day', 'night')")
@@ -388,15 +409,12 @@ class ScheduleEntity(BaseModel):
             raise ValueError(f"shift_type must be one of {cls.VALID_SHIFT_TYPES}")
         return v
 
-    @field_validator("valid_to")
-    @classmethod
-    def valid_to_after_valid_from(cls, v: Optional[date_type], info: ValidationInfo) -> Optional[date_type]:
+    @model_validator(mode="after")
+    def valid_to_after_valid_from(self) -> "ScheduleEntity":
         """Ensure valid_to >= valid_from when both are set."""
-        if v is not None:
-            valid_from = info.data.get("valid_from")
-            if valid_from and v < valid_from:
-                raise ValueError("valid_to must be >= valid_from")
-        return v
+        if self.valid_to is not None and self.valid_to < self.valid_from:
+            raise ValueError("valid_to must be >= valid_from")
+        return self
 
     def is_effective_on(self, target_date: date_type) -> bool:
         """Check if this schedule is effective on the given date."""
@@ -414,30 +432,26 @@ class ScheduleEntity(BaseModel):
             raise ValueError("device_id must be a positive integer")
         return v
 
-    @field_validator("extra_hours")
-    @classmethod
-    def validate_extra_hours(
-        cls, v: Optional[Dict[str, List[ExtraHour]]], info: ValidationInfo
-    ) -> Optional[Dict[str, List[ExtraHour]]]:
+    @model_validator(mode="after")
+    def validate_extra_hours(self) -> "ScheduleEntity":
         """Validate extra hours days and overlaps; normalize day keys to lowercase."""
+        v = self.extra_hours
         if not v:
-            return v
+            return self
 
-        schedule: Schedule = info.data.get("schedule")
-        valid_days = set(Schedule.VALID_DAYS)
+        active = set(self.schedule.active_days)
 
-        for day in v.keys():
-            if day.lower() not in valid_days:
+        # Lowercase each key once; reused for membership checks and normalization.
+        lowered = [(day, day.lower()) for day in v]
+        for day, day_l in lowered:
+            if day_l not in Schedule.VALID_DAYS_SET:
                 raise ValueError(f"Invalid extra hour day: {day}")
 
-        if schedule:
-            active_days_list = schedule.active_days
-            active = set(active_days_list)
-            invalid_inactive = [d for d in v.keys() if d.lower() not in active]
-            if invalid_inactive:
-                raise ValueError(
-                    f"Extra hours days must be within active_days: {invalid_inactive}"
-                )
+        invalid_inactive = [day for day, day_l in lowered if day_l not in active]
+        if invalid_inactive:
+            raise ValueError(
+                f"Extra hours days must be within active_days: {invalid_inactive}"
+            )
 
         for day, blocks in v.items():
             sorted_blocks = sorted(blocks, key=lambda b: _parse_hhmm(b.start))
@@ -451,7 +465,8 @@ class ScheduleEntity(BaseModel):
                     )
                 last_end = end_dt
 
-        return {k.lower(): v[k] for k in v}
+        self.extra_hours = {day_l: v[day] for day, day_l in lowered}
+        return self
 
     @field_validator("special_days")
     @classmethod
@@ -468,7 +483,7 @@ class ScheduleEntity(BaseModel):
                     f"Invalid date format: {date_str}. Use YYYY-MM-DD format"
                 )
             try:
-                datetime.strptime(date_str, "%Y-%m-%d")
+                date_type.fromisoformat(date_str)
             except ValueError:
                 raise ValueError(f"Invalid date: {date_str}")
 
@@ -489,13 +504,17 @@ class ScheduleEntity(BaseModel):
         return total_minutes
 
     def get_weekly_work_minutes(self) -> int:
-        """Calculate total work minutes for the week."""
-        total = 0
-        for day in Schedule.VALID_DAYS:
-            total += self.get_total_work_minutes_for_day(day)
-        return total
+        """Calculate total work minutes for the week.
+
+        Only iterates active days — extra hours are validated to be a
+        subset of active days, so inactive days always contribute 0.
+        """
+        return sum(
+            self.get_total_work_minutes_for_day(day)
+            for day in self.schedule.day_schedules
+        )
 
-    def get_effective_schedule_for_date(self, target_date: date_type) -> Optional[DaySchedule]:
+    def get_effective_schedule_for_date(self, target_date: date_type) -> Optional[EffectiveSchedule]:
         """
         Get the effective schedule for a specific date.
 
@@ -504,30 +523,26 @@ class ScheduleEntity(BaseModel):
         2. Recurring special day with month-day match
         3. Regular weekday schedule (lowest priority)
         """
-        date_str = target_date.strftime("%Y-%m-%d")
+        date_str = target_date.isoformat()
 
         # Priority 1: Check exact date special day
         if self.special_days and date_str in self.special_days:
             special = self.special_days[date_str]
             if special.work_hours:
-                return DaySchedule(
-                    work_hours=special.work_hours,
-                    breaks=special.breaks,
-                )
+                return EffectiveSchedule(special.work_hours, special.breaks)
             return None
 
         # Priority 2: Check recurring special days (match month-day)
         if self.special_days:
-            month_day = target_date.strftime("%m-%d")
+            month_day = f"{target_date.month:02d}-{target_date.day:02d}"
             for special_date_str, special in self.special_days.items():
                 if special.is_recurring and special_date_str.endswith(month_day):
                     if special.work_hours:
-                        return DaySchedule(
-                            work_hours=special.work_hours,
-                            break_time=special.break_time,
-                        )
+                        return EffectiveSchedule(special.work_hours, special.breaks)
                     return None
 
         # Priority 3: Fall back to regular weekday schedule
-        weekday = target_date.strftime("%A").lower()
-        return self.schedule.day_schedules.get(weekday)
+        day_schedule = self.schedule.day_schedules.get(_VALID_DAYS[target_date.weekday()])
+        if day_schedule is None:
+            return None
+        return EffectiveSchedule(day_schedule.work_hours, day_schedule.breaks)
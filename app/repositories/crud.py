@@ -7,14 +7,127 @@ providing a clean interface between the service layer and the database.
 All methods accept an asyncpg.Pool as the first parameter (injected via dependency).
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import date
+from functools import lru_cache
 
 import asyncpg
-import json
+import orjson
 from loguru import logger
 
 
+# Shared SELECT prefix for full schedule rows. Queries are module-level
+# constants so every call sends byte-identical SQL, keeping asyncpg's
+# per-connection prepared-statement cache hot.
+_SELECT_SCHEDULE = """
+    SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
+           s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
+           d.device_key AS device_name
+    FROM device_schedules s
+    LEFT JOIN devices d ON d.id = s.device_id
+"""
+
+_Q_INSERT = """
+    INSERT INTO device_schedules (
+        device_id, shift_type, day_schedules, extra_hours, special_days,
+        valid_from, valid_to, version, source, updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
+    RETURNING id;
+"""
+
+_Q_GET_BY_ID = _SELECT_SCHEDULE + "WHERE s.id = $1;"
+
+_Q_GET_CURRENT_BY_DEVICE_ID = _SELECT_SCHEDULE + """WHERE s.device_id = $1
+      AND s.shift_type = $2
+      AND s.valid_range @> CURRENT_DATE;"""
+
+_Q_GET_ALL_CURRENT_BY_DEVICE_ID = _SELECT_SCHEDULE + """WHERE s.device_id = $1
+      AND s.valid_range @> CURRENT_DATE
+    ORDER BY s.shift_type;"""
+
+_Q_GET_BY_DEVICE_ID_AND_DATE = _SELECT_SCHEDULE + """WHERE s.device_id = $1
+      AND s.shift_type = $3
+      AND s.valid_range @> $2::date;"""
+
+_Q_GET_ALL_BY_DEVICE_ID_AND_DATE = _SELECT_SCHEDULE + """WHERE s.device_id = $1
+      AND s.valid_range @> $2::date
+    ORDER BY s.shift_type;"""
+
+_Q_GET_ALL_BY_DEVICE_ID = _SELECT_SCHEDULE + """WHERE s.device_id = $1
+    ORDER BY s.valid_from DESC, s.shift_type;"""
+
+# LIMIT NULL means "no limit" in PostgreSQL, so one statement serves both the
+# paginated and unpaginated cases without generating variant SQL texts.
+_Q_GET_ALL_IN_RANGE = _SELECT_SCHEDULE + """WHERE s.valid_range && daterange($1::date, $2::date, '[]')
+    ORDER BY s.device_id, s.shift_type, s.valid_from
+    LIMIT $3 OFFSET $4;"""
+
+_Q_GET_ALL_CURRENT_BY_DEVICE_IDS = _SELECT_SCHEDULE + """WHERE s.device_id = ANY($1::bigint[])
+      AND s.valid_range @> CURRENT_DATE
+    ORDER BY s.device_id, s.shift_type;"""
+
+_Q_GET_ALL_CURRENT = _SELECT_SCHEDULE + """WHERE s.valid_range @> CURRENT_DATE
+    ORDER BY s.device_id, s.shift_type
+    LIMIT $1 OFFSET $2;"""
+
+_Q_GET_BY_DAY = _SELECT_SCHEDULE + """WHERE s.day_schedules ? $1
+      AND s.valid_range @> CURRENT_DATE
+    ORDER BY s.device_id, s.shift_type;"""
+
+# Narrow projection for /stats/all: only the current day's config is
+# extracted server-side, so Python never decodes the other six days nor
+# the extra_hours/special_days blobs. NULL today = inactive device.
+_Q_GET_STATS_PROJECTION = """
+    SELECT s.device_id, s.day_schedules -> $1 AS today
+    FROM device_schedules s
+    WHERE s.valid_range @> CURRENT_DATE
+    ORDER BY s.device_id, s.shift_type;
+"""
+
+
+async def warm_statement_cache(conn: asyncpg.Connection) -> None:
+    """
+    Prime a connection's prepared-statement cache with the hottest queries.
+
+    Run from the pool's init callback so every connection is born warm:
+    the first real request on it skips the parse/plan round trip. The
+    parameter values are inert (id 0, empty day, LIMIT 0) — each call is
+    answered from an index or returns nothing.
+    """
+    await conn.fetchrow(_Q_GET_BY_ID, 0)
+    await conn.fetchrow(_Q_GET_CURRENT_BY_DEVICE_ID, 0, "day")
+    await conn.fetch(_Q_GET_ALL_CURRENT_BY_DEVICE_ID, 0)
+    await conn.fetchrow(_Q_GET_BY_DEVICE_ID_AND_DATE, 0, date(1970, 1, 1), "day")
+    await conn.fetch(_Q_GET_ALL_CURRENT, 0, 0)
+    await conn.fetch(_Q_GET_BY_DAY, "")
+
+
+@lru_cache(maxsize=64)
+def _partial_update_query(fields: tuple) -> str:
+    """Build the UPDATE statement for one combination of updated fields.
+
+    Memoized so each field combination maps to a single stable SQL text,
+    letting asyncpg's statement cache reuse the prepared plan instead of
+    re-parsing a freshly built string on every call. A fixed COALESCE
+    statement is not an option here: PATCH must be able to set nullable
+    columns (e.g. special_days) to NULL explicitly.
+    """
+    assignments = ", ".join(
+        f"{field} = ${idx}" for idx, field in enumerate(fields, start=2)
+    )
+    # RETURNING the full row (device_name resolved via subquery, matching
+    # _SELECT_SCHEDULE) saves the re-fetch round trip after every write.
+    return (
+        "UPDATE device_schedules SET "
+        + assignments
+        + ", updated_at = NOW() WHERE id = $1"
+        + " RETURNING id, device_id, shift_type, day_schedules, extra_hours, special_days,"
+        + " valid_from, valid_to, created_at, updated_at, version, source,"
+        + " (SELECT device_key FROM devices WHERE devices.id = device_schedules.device_id) AS device_name"
+    )
+
+
 class ScheduleCRUD:
     """CRUD operations for schedule management (N schedules per device with date ranges)."""
 
@@ -26,29 +139,57 @@ class ScheduleCRUD:
         Returns:
             ID of the created schedule
         """
-        async with pool.acquire() as conn:
-            result = await conn.fetchval(
-                """
-                INSERT INTO device_schedules (
-                    device_id, shift_type, day_schedules, extra_hours, special_days,
-                    valid_from, valid_to, version, source, updated_at
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
-                RETURNING id;
-                """,
-                schedule_data["device_id"],
-                schedule_data.get("shift_type", "day"),
-                schedule_data["day_schedules"],
-                schedule_data.get("extra_hours"),
-                schedule_data.get("special_days"),
-                schedule_data["valid_from"],
-                schedule_data.get("valid_to"),
-                schedule_data.get("version", "1.0"),
-                schedule_data.get("source", "ui"),
+        result = await pool.fetchval(
+            _Q_INSERT,
+            schedule_data["device_id"],
+            schedule_data.get("shift_type", "day"),
+            schedule_data["day_schedules"],
+            schedule_data.get("extra_hours"),
+            schedule_data.get("special_days"),
+            schedule_data["valid_from"],
+            schedule_data.get("valid_to"),
+            schedule_data.get("version", "1.0"),
+            schedule_data.get("source", "ui"),
+        )
+
+        logger.debug(f"Schedule inserted for device_id={schedule_data['device_id']} (id={result})")
+        return result
+
+    @staticmethod
+    async def insert_many(pool: asyncpg.Pool, schedules: List[Dict[str, Any]]) -> int:
+        """
+        Insert a batch of schedules in a single transaction.
+
+        Uses executemany so the INSERT is prepared once and all rows are
+        sent in one pipelined batch instead of one round-trip per schedule.
+
+        Returns:
+            Number of schedules inserted
+        """
+        if not schedules:
+            return 0
+
+        args = [
+            (
+                s["device_id"],
+                s.get("shift_type", "day"),
+                s["day_schedules"],
+                s.get("extra_hours"),
+                s.get("special_days"),
+                s["valid_from"],
+                s.get("valid_to"),
+                s.get("version", "1.0"),
+                s.get("source", "ui"),
             )
+            for s in schedules
+        ]
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(_Q_INSERT, args)
 
-            logger.info(f"Schedule inserted for device_id={schedule_data['device_id']} (id={result})")
-            return result
+        logger.info(f"Bulk inserted {len(args)} schedules")
+        return len(args)
 
     @staticmethod
     async def create_with_auto_close(pool: asyncpg.Pool, schedule_data: Dict[str, Any]) -> int:
@@ -102,7 +243,7 @@ class ScheduleCRUD:
                     schedule_data.get("source", "ui"),
                 )
 
-                logger.info(
+                logger.debug(
                     f"Schedule created with auto-close for device_id={schedule_data['device_id']} "
                     f"shift_type={shift_type} (id={result})"
                 )
@@ -220,7 +361,7 @@ class ScheduleCRUD:
                     schedule_data.get("source", "ui"),
                 )
 
-                logger.info(
+                logger.debug(
                     f"Schedule created with split for device_id={device_id} "
                     f"shift_type={shift_type} (id={result})"
                 )
@@ -229,18 +370,7 @@ class ScheduleCRUD:
     @staticmethod
     async def get_by_id(pool: asyncpg.Pool, schedule_id: int) -> Optional[asyncpg.Record]:
         """Get a schedule by its primary key."""
-        async with pool.acquire() as conn:
-            return await conn.fetchrow(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.id = $1;
-                """,
-                schedule_id,
-            )
+        return await pool.fetchrow(_Q_GET_BY_ID, schedule_id)
 
     @staticmethod
     async def get_current_by_device_id(
@@ -250,21 +380,31 @@ class ScheduleCRUD:
         Get the currently effective schedule for a device and shift_type
         (valid_range @> CURRENT_DATE).
         """
-        async with pool.acquire() as conn:
-            return await conn.fetchrow(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.device_id = $1
-                  AND s.shift_type = $2
-                  AND s.valid_range @> CURRENT_DATE;
-                """,
-                device_id,
-                shift_type,
-            )
+        return await pool.fetchrow(_Q_GET_CURRENT_BY_DEVICE_ID, device_id, shift_type)
+
+    @staticmethod
+    async def get_current_metadata_by_device_id(
+        pool: asyncpg.Pool, device_id: int, shift_type: str = "day",
+    ) -> Optional[asyncpg.Record]:
+        """
+        Get only the metadata of a device's current schedule (no JSONB columns).
+
+        Selects exactly the columns covered by idx_device_schedules_metadata_cover,
+        so PostgreSQL can answer with an index-only scan and asyncpg never
+        decodes the schedule blobs.
+        """
+        return await pool.fetchrow(
+            """
+            SELECT id, device_id, shift_type, valid_from, valid_to,
+                   version, source, created_at, updated_at
+            FROM device_schedules
+            WHERE device_id = $1
+              AND shift_type = $2
+              AND valid_range @> CURRENT_DATE;
+            """,
+            device_id,
+            shift_type,
+        )
 
     @staticmethod
     async def get_all_current_by_device_id(
@@ -273,271 +413,278 @@ class ScheduleCRUD:
         """
         Get all currently effective schedules for a device (all shift types).
         """
-        async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.device_id = $1
-                  AND s.valid_range @> CURRENT_DATE
-                ORDER BY s.shift_type;
-                """,
-                device_id,
-            )
+        return await pool.fetch(_Q_GET_ALL_CURRENT_BY_DEVICE_ID, device_id)
+
+    @staticmethod
+    async def get_all_current_by_device_ids(
+        pool: asyncpg.Pool, device_ids: List[int],
+    ) -> List[asyncpg.Record]:
+        """
+        Get the currently effective schedules for several devices in one query.
+
+        Replaces N per-device round-trips with a single ANY($1) index scan;
+        callers needing multiple devices should prefer this over looping
+        get_all_current_by_device_id.
+        """
+        return await pool.fetch(_Q_GET_ALL_CURRENT_BY_DEVICE_IDS, device_ids)
 
     @staticmethod
     async def get_by_device_id_and_date(
         pool: asyncpg.Pool, device_id: int, target_date: date, shift_type: str = "day",
     ) -> Optional[asyncpg.Record]:
         """Get the schedule for a device effective on a specific date (single shift type)."""
-        async with pool.acquire() as conn:
-            return await conn.fetchrow(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.device_id = $1
-                  AND s.shift_type = $3
-                  AND s.valid_range @> $2::date;
-                """,
-                device_id,
-                target_date,
-                shift_type,
-            )
+        return await pool.fetchrow(_Q_GET_BY_DEVICE_ID_AND_DATE, device_id, target_date, shift_type)
 
     @staticmethod
     async def get_all_by_device_id_and_date(
         pool: asyncpg.Pool, device_id: int, target_date: date,
     ) -> List[asyncpg.Record]:
         """Get all schedules for a device effective on a specific date (all shift types)."""
-        async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.device_id = $1
-                  AND s.valid_range @> $2::date
-                ORDER BY s.shift_type;
-                """,
-                device_id,
-                target_date,
-            )
+        return await pool.fetch(_Q_GET_ALL_BY_DEVICE_ID_AND_DATE, device_id, target_date)
 
     @staticmethod
     async def get_all_by_device_id(pool: asyncpg.Pool, device_id: int) -> List[asyncpg.Record]:
         """Get all schedules (history) for a device, ordered by valid_from DESC."""
-        async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.device_id = $1
-                ORDER BY s.valid_from DESC, s.shift_type;
-                """,
-                device_id,
-            )
+        return await pool.fetch(_Q_GET_ALL_BY_DEVICE_ID, device_id)
 
     @staticmethod
     async def get_all_in_range(
         pool: asyncpg.Pool, range_from: date, range_to: date,
+        limit: Optional[int] = None, offset: int = 0,
     ) -> List[asyncpg.Record]:
-        """Get all schedules that overlap with a date range."""
-        async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.valid_range && daterange($1::date, $2::date, '[]')
-                ORDER BY s.device_id, s.shift_type, s.valid_from;
-                """,
-                range_from,
-                range_to,
-            )
+        """Get all schedules that overlap with a date range (optionally paginated)."""
+        return await pool.fetch(_Q_GET_ALL_IN_RANGE, range_from, range_to, limit, offset)
 
     @staticmethod
-    async def get_all_current(pool: asyncpg.Pool) -> List[asyncpg.Record]:
+    async def get_all_current(
+        pool: asyncpg.Pool, limit: Optional[int] = None, offset: int = 0,
+    ) -> List[asyncpg.Record]:
         """Get all currently effective schedules (may return multiple per device if day+night)."""
+        return await pool.fetch(_Q_GET_ALL_CURRENT, limit, offset)
+
+    @staticmethod
+    async def get_listing_version(pool: asyncpg.Pool) -> Optional[asyncpg.Record]:
+        """
+        Get a cheap change marker for the schedule listing (max updated_at + count).
+
+        Used to derive ETags: answering this from the BRIN/B-tree indexes is
+        far cheaper than fetching and serializing the full listing.
+        """
+        return await pool.fetchrow(
+            "SELECT MAX(updated_at) AS last_updated, COUNT(*) AS total FROM device_schedules;"
+        )
+
+    @staticmethod
+    async def get_all_current_summary(pool: asyncpg.Pool) -> List[asyncpg.Record]:
+        """
+        Get a lightweight listing of all current schedules (no JSONB columns).
+
+        Skips decoding day_schedules/extra_hours/special_days entirely, so the
+        cost per row is a fraction of get_all_current's.
+        """
+        return await pool.fetch(
+            """
+            SELECT s.id, s.device_id, d.device_key AS device_name, s.shift_type,
+                   s.valid_from, s.valid_to, s.updated_at
+            FROM device_schedules s
+            JOIN devices d ON d.id = s.device_id
+            WHERE s.valid_range @> CURRENT_DATE
+            ORDER BY s.device_id, s.shift_type;
+            """
+        )
+
+    @staticmethod
+    async def iter_all_current(
+        pool: asyncpg.Pool, prefetch: int = 500,
+    ) -> AsyncIterator[asyncpg.Record]:
+        """
+        Stream all currently effective schedules via a server-side cursor.
+
+        Unlike get_all_current, this never materializes the full row list,
+        so large deployments can be exported without holding every schedule
+        (and its decoded JSONB) in memory at once.
+        """
         async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.valid_range @> CURRENT_DATE
-                ORDER BY s.device_id, s.shift_type;
-                """
-            )
+            async with conn.transaction():
+                async for row in conn.cursor(_Q_GET_ALL_CURRENT, None, 0, prefetch=prefetch):
+                    yield row
 
     @staticmethod
     async def get_by_day(pool: asyncpg.Pool, day: str) -> List[asyncpg.Record]:
         """Get all currently effective schedules that include a specific day."""
-        async with pool.acquire() as conn:
-            return await conn.fetch(
-                """
-                SELECT s.id, s.device_id, s.shift_type, s.day_schedules, s.extra_hours, s.special_days,
-                       s.valid_from, s.valid_to, s.created_at, s.updated_at, s.version, s.source,
-                       d.device_key AS device_name
-                FROM device_schedules s
-                LEFT JOIN devices d ON d.id = s.device_id
-                WHERE s.day_schedules ? $1
-                  AND s.valid_range @> CURRENT_DATE
-                ORDER BY s.device_id, s.shift_type;
-                """,
-                day,
-            )
+        return await pool.fetch(_Q_GET_BY_DAY, day)
+
+    @staticmethod
+    async def get_stats_projection(pool: asyncpg.Pool, day: str) -> List[asyncpg.Record]:
+        """
+        Get (device_id, today's day config) for every current schedule.
+
+        The day extraction happens in PostgreSQL, so the stats loop only
+        decodes the one small JSONB object it actually needs per device.
+        """
+        return await pool.fetch(_Q_GET_STATS_PROJECTION, day)
+
+    @staticmethod
+    async def get_device_names_by_day(pool: asyncpg.Pool, day: str) -> List[str]:
+        """
+        Get only the device names with a currently effective schedule on a day.
+
+        Narrow-column variant of get_by_day for listing callers that do not
+        need the JSONB payloads; skips decoding the schedule blobs entirely.
+        """
+        rows = await pool.fetch(
+            """
+            SELECT d.device_key AS device_name
+            FROM device_schedules s
+            JOIN devices d ON d.id = s.device_id
+            WHERE s.day_schedules ? $1
+              AND s.valid_range @> CURRENT_DATE
+            ORDER BY d.device_key;
+            """,
+            day,
+        )
+        return [row["device_name"] for row in rows]
 
     @staticmethod
     async def partial_update(
         pool: asyncpg.Pool,
         schedule_id: int,
         update_data: Dict[str, Any],
-    ) -> bool:
+    ) -> Optional[asyncpg.Record]:
         """
         Partially update a schedule by its primary key.
 
         Returns:
-            True if schedule was updated, False if not found
+            The updated row (including device_name), or None if not found
+            or nothing was to be written.
         """
-        async with pool.acquire() as conn:
-            existing = await conn.fetchrow(
-                "SELECT id FROM device_schedules WHERE id = $1",
-                schedule_id,
-            )
-            if not existing:
-                return False
-
-            update_fields = []
-            values = []
-            param_idx = 2  # $1 is schedule_id
-
-            for field, value in update_data.items():
-                update_fields.append(f"{field} = ${param_idx}")
-                values.append(value)
-                param_idx += 1
-
-            if not update_fields:
-                return True
-
-            update_fields.append("updated_at = NOW()")
-
-            query = f"""
-                UPDATE device_schedules
-                SET {', '.join(update_fields)}
-                WHERE id = $1
-            """
+        if not update_data:
+            # No-op patch: nothing to write, skip the round trip entirely.
+            # Callers already hold the current row and can reuse it.
+            return None
 
-            await conn.execute(query, schedule_id, *values)
-            logger.info(f"Schedule id={schedule_id} partially updated")
-            return True
+        query = _partial_update_query(tuple(update_data))
+        row = await pool.fetchrow(query, schedule_id, *update_data.values())
+        logger.debug(f"Schedule id={schedule_id} partially updated: {row is not None}")
+        return row
 
     @staticmethod
     async def delete_current_by_device_id(
         pool: asyncpg.Pool, device_id: int, shift_type: str = "day",
     ) -> bool:
         """Delete the currently effective schedule for a device and shift_type."""
-        async with pool.acquire() as conn:
-            result = await conn.execute(
-                """
-                DELETE FROM device_schedules
-                WHERE device_id = $1
-                  AND shift_type = $2
-                  AND valid_range @> CURRENT_DATE;
-                """,
-                device_id,
-                shift_type,
-            )
-            deleted_count = int(result.split()[-1])
-            logger.info(f"Current schedule for device_id={device_id} shift_type={shift_type} deleted: {deleted_count > 0}")
-            return deleted_count > 0
+        row = await pool.fetchval(
+            """
+            DELETE FROM device_schedules
+            WHERE device_id = $1
+              AND shift_type = $2
+              AND valid_range @> CURRENT_DATE
+            RETURNING 1;
+            """,
+            device_id,
+            shift_type,
+        )
+        logger.debug(f"Current schedule for device_id={device_id} shift_type={shift_type} deleted: {row is not None}")
+        return row is not None
 
     @staticmethod
     async def delete_by_id(pool: asyncpg.Pool, schedule_id: int) -> bool:
         """Delete a specific schedule by its primary key."""
-        async with pool.acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM device_schedules WHERE id = $1",
-                schedule_id,
-            )
-            deleted_count = int(result.split()[-1])
-            logger.info(f"Schedule id={schedule_id} deleted: {deleted_count > 0}")
-            return deleted_count > 0
+        row = await pool.fetchval(
+            "DELETE FROM device_schedules WHERE id = $1 RETURNING 1",
+            schedule_id,
+        )
+        logger.debug(f"Schedule id={schedule_id} deleted: {row is not None}")
+        return row is not None
 
     @staticmethod
     async def get_special_days(
         pool: asyncpg.Pool, device_id: int, shift_type: str = "day",
     ) -> Optional[Dict[str, Any]]:
         """Get special_days JSONB for the current schedule of a device and shift_type."""
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT special_days FROM device_schedules
-                WHERE device_id = $1
-                  AND shift_type = $2
-                  AND valid_range @> CURRENT_DATE;
-                """,
-                device_id,
-                shift_type,
-            )
-            if row is None:
-                return None
+        row = await pool.fetchrow(
+            """
+            SELECT special_days FROM device_schedules
+            WHERE device_id = $1
+              AND shift_type = $2
+              AND valid_range @> CURRENT_DATE;
+            """,
+            device_id,
+            shift_type,
+        )
+        if row is None:
+            return None
 
-            data = row["special_days"]
-            if not data:
-                return {}
-            if isinstance(data, str):
-                return json.loads(data)
-            return data
+        data = row["special_days"]
+        if not data:
+            return {}
+        if isinstance(data, str):
+            return orjson.loads(data)
+        return data
 
     @staticmethod
-    async def get_device_id_by_name(pool: asyncpg.Pool, device_name: str) -> Optional[int]:
+    async def get_special_days_in_range(
+        pool: asyncpg.Pool,
+        device_id: int,
+        from_date: str,
+        to_date: str,
+        shift_type: str = "day",
+    ) -> Optional[Dict[str, Any]]:
         """
-        Look up a device ID by name.
+        Get special_days entries within a date range for the current schedule.
 
-        Searches across device_key, display_name, and device_code
-        to match flexibly.
+        Filtering happens in PostgreSQL via jsonb_each, so only the matching
+        entries cross the wire instead of the whole special_days blob.
+
+        Returns:
+            Dict of matching entries ({} if none), or None if no schedule exists.
         """
-        async with pool.acquire() as conn:
-            # Exact match on device_key
-            row = await conn.fetchrow(
-                "SELECT id FROM devices WHERE device_key = $1",
-                device_name,
-            )
-            if row:
-                return row["id"]
+        row = await pool.fetchrow(
+            """
+            SELECT COALESCE(
+                (SELECT jsonb_object_agg(sd.key, sd.value)
+                 FROM jsonb_each(s.special_days) AS sd
+                 WHERE sd.key BETWEEN $3 AND $4),
+                '{}'::jsonb
+            ) AS special_days
+            FROM device_schedules s
+            WHERE s.device_id = $1
+              AND s.shift_type = $2
+              AND s.valid_range @> CURRENT_DATE;
+            """,
+            device_id,
+            shift_type,
+            from_date,
+            to_date,
+        )
+        if row is None:
+            return None
 
-            # Exact match on display_name
-            row = await conn.fetchrow(
-                "SELECT id FROM devices WHERE display_name = $1",
-                device_name,
-            )
-            if row:
-                return row["id"]
+        data = row["special_days"]
+        if isinstance(data, str):
+            return orjson.loads(data)
+        return data
 
-            # Partial match on display_name
-            row = await conn.fetchrow(
-                "SELECT id FROM devices WHERE display_name ILIKE '%' || $1 || '%'",
-                device_name,
-            )
-            if row:
-                return row["id"]
+    @staticmethod
+    async def get_device_id_by_name(pool: asyncpg.Pool, device_name: str) -> Optional[int]:
+        """
+        Look up a device ID by name.
 
-            return None
+        Matches flexibly in a single round trip, ranked by specificity:
+        exact device_key, then exact display_name, then partial display_name.
+        """
+        return await pool.fetchval(
+            """
+            SELECT id
+            FROM devices
+            WHERE device_key = $1
+               OR display_name = $1
+               OR display_name ILIKE '%' || $1 || '%'
+            ORDER BY (device_key = $1) DESC, (display_name = $1) DESC
+            LIMIT 1;
+            """,
+            device_name,
+        )
 
 
 schedule_crud = ScheduleCRUD()
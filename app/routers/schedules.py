@@ -2,38 +2,62 @@
 Schedule API router — thin controllers delegating to the service layer.
 """
 
+import hashlib
+import re
 from datetime import date
 from typing import Annotated, Any, Dict, List, Optional
 
 import asyncpg
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 
-from ..core.dependencies import get_db_pool, verify_api_key
+from ..core.dependencies import get_db_pool
 from ..schemas.schedule import (
-    AllScheduleStatsResponse,
     DayScheduleSchema,
     ScheduleCreate,
     ScheduleDeleteResponse,
     SchedulePatch,
     ScheduleRead,
+    ScheduleSummary,
     ScheduleUpdate,
-    SingleScheduleStatsResponse,
     SpecialDaySchema,
 )
 from ..services.schedule_service import schedule_service
 
-router = APIRouter(prefix="/schedules", tags=["schedules"])
+# ORJSONResponse serializes with orjson's C encoder (datetimes included),
+# several times faster than the default json path on large schedule lists.
+router = APIRouter(
+    prefix="/schedules",
+    tags=["schedules"],
+    default_response_class=ORJSONResponse,
+)
 
 # ── Reusable Annotated types ──────────────────────────────────────────
 
 Pool = Annotated[asyncpg.Pool, Depends(get_db_pool)]
-ApiKey = Annotated[None, Depends(verify_api_key)]
 
 DATE_QUERY_DESC = "Target date (YYYY-MM-DD) to resolve schedule"
 DateQuery = Annotated[Optional[date], Query(alias="date", description=DATE_QUERY_DESC)]
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_fromisoformat = date.fromisoformat
+
+
+def parse_iso_date(date: str):
+    """Parse a YYYY-MM-DD path/query parameter once (C fast path), 400 on bad input."""
+    if not _ISO_DATE_RE.match(date):
+        raise HTTPException(status_code=400, detail="Formato de fecha inválido. Use YYYY-MM-DD")
+    try:
+        return _fromisoformat(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Formato de fecha inválido. Use YYYY-MM-DD")
+
+
+ParsedDate = Annotated[date, Depends(parse_iso_date)]
+
 SHIFT_TYPE_DESC = "Shift type: 'day' or 'night' (defaults to 'day')"
 ShiftTypeQuery = Annotated[str, Query(alias="shiftType", description=SHIFT_TYPE_DESC)]
 OptionalShiftTypeQuery = Annotated[Optional[str], Query(alias="shiftType", description="Filter by shift type: 'day' or 'night'. Omit to get all.")]
@@ -52,10 +76,18 @@ RESPONSES_500 = {**_500}
 
 # ========== Documentation Endpoints ==========
 
+# The router's routes are fixed at import time, so the schema (and its
+# serialized bytes) are computed once on first request instead of walking
+# every Pydantic model per call.
+_cached_openapi: Optional[bytes] = None
+_cached_openapi_etag: Optional[str] = None
 
-@router.get("/openapi.json", include_in_schema=False)
-async def get_schedules_openapi():
-    """Get OpenAPI JSON schema for schedules API only."""
+_DOCS_PATHS = frozenset({"/schedules/docs", "/schedules/redoc", "/schedules/openapi.json"})
+_API_PREFIX = "/shifts-api/v1"
+
+
+def _build_openapi() -> bytes:
+    """Build and serialize the prefixed OpenAPI schema for this router."""
     openapi_schema = get_openapi(
         title="Shifts API - Schedule Management",
         version="1.0.0",
@@ -63,272 +95,258 @@ async def get_schedules_openapi():
         routes=router.routes,
     )
 
-    prefix = "/shifts-api/v1"
-    prefixed_paths = {}
-    for path, path_item in openapi_schema.get("paths", {}).items():
-        if path in ["/schedules/docs", "/schedules/redoc", "/schedules/openapi.json"]:
-            continue
-        prefixed_paths[f"{prefix}{path}"] = path_item
+    paths = openapi_schema.get("paths", {})
+    for path in list(paths):
+        if path in _DOCS_PATHS:
+            del paths[path]
+        else:
+            paths[_API_PREFIX + path] = paths.pop(path)
+
+    return orjson.dumps(openapi_schema)
+
+
+@router.get("/openapi.json", include_in_schema=False)
+async def get_schedules_openapi(request: Request):
+    """Get OpenAPI JSON schema for schedules API only."""
+    global _cached_openapi, _cached_openapi_etag
+    if _cached_openapi is None:
+        _cached_openapi = _build_openapi()
+        _cached_openapi_etag = 'W/"' + hashlib.blake2b(_cached_openapi, digest_size=16).hexdigest() + '"'
+    if request.headers.get("if-none-match") == _cached_openapi_etag:
+        return Response(status_code=304, headers={"ETag": _cached_openapi_etag})
+    return Response(
+        content=_cached_openapi,
+        media_type="application/json",
+        headers={"ETag": _cached_openapi_etag},
+    )
+
+
+# The docs pages are built from constant arguments, so their HTML is rendered
+# once at import time and served as static bytes.
+_SWAGGER_HTML: bytes = get_swagger_ui_html(
+    openapi_url="/shifts-api/v1/schedules/openapi.json",
+    title="Shifts API - Swagger UI",
+    swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
+    swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
+).body
+
+_REDOC_HTML: bytes = get_redoc_html(
+    openapi_url="/shifts-api/v1/schedules/openapi.json",
+    title="Shifts API - ReDoc",
+    redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@2.1.0/bundles/redoc.standalone.js",
+).body
 
-    openapi_schema["paths"] = prefixed_paths
-    return openapi_schema
+# The HTML shells only change on deploy, so browsers and reverse proxies
+# can cache them for a day and skip the handler entirely.
+_DOCS_CACHE_HEADERS = {"Cache-Control": "public, max-age=86400, immutable"}
 
 
 @router.get("/docs", include_in_schema=False)
 async def get_schedules_docs():
     """Get Swagger UI documentation for schedules API."""
-    return get_swagger_ui_html(
-        openapi_url="/shifts-api/v1/schedules/openapi.json",
-        title="Shifts API - Swagger UI",
-        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
-        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
-    )
+    return Response(content=_SWAGGER_HTML, media_type="text/html", headers=_DOCS_CACHE_HEADERS)
 
 
 @router.get("/redoc", include_in_schema=False)
 async def get_schedules_redoc():
     """Get ReDoc documentation for schedules API."""
-    return get_redoc_html(
-        openapi_url="/shifts-api/v1/schedules/openapi.json",
-        title="Shifts API - ReDoc",
-        redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@2.1.0/bundles/redoc.standalone.js",
-    )
+    return Response(content=_REDOC_HTML, media_type="text/html", headers=_DOCS_CACHE_HEADERS)
 
 
 # ========== Schedule CRUD Endpoints ==========
 
 
-@router.post("/", response_model=ScheduleRead, responses=RESPONSES_404_400_500)
+@router.post("/", response_model=None, responses=RESPONSES_404_400_500)
 async def create_schedule(
     data: ScheduleCreate,
     pool: Pool,
-    _: ApiKey,
-):
+) -> ScheduleRead:
     """Create a schedule for a device (auto-closes previous open-ended schedule)."""
-    try:
-        return await schedule_service.create_schedule(pool, data)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al crear el horario: {e}")
+    return await schedule_service.create_schedule(pool, data)
 
 
-@router.put("/{device_id}", response_model=ScheduleRead, responses=RESPONSES_404_400_500)
+@router.put("/{device_id}", response_model=None, responses=RESPONSES_404_400_500)
 async def update_schedule(
     device_id: int,
     data: ScheduleUpdate,
     pool: Pool,
-    _: ApiKey,
     date_param: DateQuery = None,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> ScheduleRead:
     """Full replacement of a schedule for a device."""
-    try:
-        return await schedule_service.update_schedule(pool, device_id, data, target_date=date_param, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al actualizar el horario: {e}")
+    return await schedule_service.update_schedule(pool, device_id, data, target_date=date_param, shift_type=shift_type)
 
 
-@router.patch("/{device_id}", response_model=ScheduleRead, responses=RESPONSES_404_400_500)
+@router.patch("/{device_id}", response_model=None, responses=RESPONSES_404_400_500)
 async def patch_schedule(
     device_id: int,
     data: SchedulePatch,
     pool: Pool,
-    _: ApiKey,
     date_param: DateQuery = None,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> ScheduleRead:
     """Partial update of a schedule for a device."""
-    try:
-        return await schedule_service.patch_schedule(pool, device_id, data, target_date=date_param, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al actualizar parcialmente: {e}")
+    return await schedule_service.patch_schedule(pool, device_id, data, target_date=date_param, shift_type=shift_type)
 
 
-@router.get("/by-day/{day}", response_model=List[ScheduleRead], responses=RESPONSES_400_500)
+@router.get("/by-day/{day}", response_model=None, responses=RESPONSES_400_500)
 async def get_schedules_by_day(
     day: str,
     pool: Pool,
-    _: ApiKey,
-):
+) -> List[ScheduleRead]:
     """Get all currently effective schedules active on a specific day of the week."""
-    try:
-        return await schedule_service.get_schedules_by_day(pool, day)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener horarios por día: {e}")
+    return await schedule_service.get_schedules_by_day(pool, day)
+
+
+@router.get("/by-day/{day}/devices", response_model=None, responses=RESPONSES_400_500)
+async def get_device_names_by_day(
+    day: str,
+    pool: Pool,
+) -> List[str]:
+    """Get only the device names with a schedule active on a specific day (lightweight listing)."""
+    return await schedule_service.get_device_names_by_day(pool, day)
 
 
-@router.get("/stats/all", response_model=AllScheduleStatsResponse, responses=RESPONSES_500)
+@router.get("/stats/all", response_model=None, responses=RESPONSES_500)
 async def get_all_stats(
     pool: Pool,
-    _: ApiKey,
 ):
     """Get work hour usage statistics for all devices."""
-    try:
-        return await schedule_service.get_all_stats(pool)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener estadísticas: {e}")
+    return ORJSONResponse(await schedule_service.get_all_stats(pool))
 
 
-@router.get("/stats/{device_id}", response_model=SingleScheduleStatsResponse, responses=RESPONSES_404_500)
+@router.get("/stats/{device_id}", response_model=None, responses=RESPONSES_404_500)
 async def get_device_stats(
     device_id: int,
     pool: Pool,
-    _: ApiKey,
     shift_type: ShiftTypeQuery = "day",
 ):
     """Get work hour usage statistics for a specific device."""
-    try:
-        return await schedule_service.get_device_stats(pool, device_id, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener estadísticas: {e}")
+    return ORJSONResponse(await schedule_service.get_device_stats(pool, device_id, shift_type=shift_type))
 
 
-@router.get("/special-days/{device_id}", response_model=Dict[str, Any], responses=RESPONSES_404_500)
+@router.get("/special-days/{device_id}", response_model=None, responses=RESPONSES_404_500)
 async def get_special_days(
     device_id: int,
     pool: Pool,
-    _: ApiKey,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> Dict[str, Any]:
     """Get special days for a device."""
-    try:
-        return await schedule_service.get_special_days(pool, device_id, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener días especiales: {e}")
+    return await schedule_service.get_special_days(pool, device_id, shift_type=shift_type)
+
+
+@router.get("/special-days/{device_id}/range", response_model=None, responses=RESPONSES_404_400_500)
+async def get_special_days_in_range(
+    device_id: int,
+    pool: Pool,
+    from_date: Annotated[str, Query(..., alias="from", pattern=r"^\d{4}-\d{2}-\d{2}$", description="Start of date range (YYYY-MM-DD)")],
+    to_date: Annotated[str, Query(..., alias="to", pattern=r"^\d{4}-\d{2}-\d{2}$", description="End of date range (YYYY-MM-DD)")],
+    shift_type: ShiftTypeQuery = "day",
+) -> Dict[str, Any]:
+    """Get special days for a device within a date range."""
+    return await schedule_service.get_special_days_in_range(pool, device_id, from_date, to_date, shift_type=shift_type)
 
 
-@router.post("/special-days/{device_id}", response_model=ScheduleRead, responses=RESPONSES_404_400_500)
+@router.post("/special-days/{device_id}", response_model=None, responses=RESPONSES_404_400_500)
 async def add_special_day(
     device_id: int,
-    date: Annotated[str, Query(..., pattern=r"^\d{4}-\d{2}-\d{2}$")],
+    date: ParsedDate,
     special_day: Annotated[SpecialDaySchema, Body(...)],
     pool: Pool,
-    _: ApiKey,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> ScheduleRead:
     """Add or update a single special day for a device."""
-    try:
-        return await schedule_service.add_special_day(pool, device_id, date, special_day, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al añadir día especial: {e}")
+    return await schedule_service.add_special_day(pool, device_id, date, special_day, shift_type=shift_type)
 
 
-@router.delete("/special-days/{device_id}/{date}", response_model=ScheduleDeleteResponse, responses=RESPONSES_404_400_500)
+@router.delete("/special-days/{device_id}/{date}", response_model=None, responses=RESPONSES_404_400_500)
 async def delete_special_day(
     device_id: int,
-    date: str,
+    date: ParsedDate,
     pool: Pool,
-    _: ApiKey,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> ScheduleDeleteResponse:
     """Delete a specific special day for a device."""
-    try:
-        return await schedule_service.delete_special_day(pool, device_id, date, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al eliminar día especial: {e}")
+    return await schedule_service.delete_special_day(pool, device_id, date, shift_type=shift_type)
 
 
-@router.get("/effective-schedule/{device_id}/{date}", response_model=Optional[DayScheduleSchema], responses=RESPONSES_404_400_500)
+@router.get("/effective-schedule/{device_id}/{date}", response_model=None, responses=RESPONSES_404_400_500)
 async def get_effective_schedule(
     device_id: int,
-    date: str,
+    date: ParsedDate,
     pool: Pool,
-    _: ApiKey,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> Optional[DayScheduleSchema]:
     """Get the effective schedule for a device on a specific date."""
-    try:
-        return await schedule_service.get_effective_schedule(pool, device_id, date, shift_type=shift_type)
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener horario efectivo: {e}")
+    return await schedule_service.get_effective_schedule(pool, device_id, date, shift_type=shift_type)
 
 
-@router.get("/", response_model=List[ScheduleRead], responses=RESPONSES_500)
+@router.get("/", response_model=None, responses=RESPONSES_500)
 async def get_all_schedules(
+    request: Request,
+    response: Response,
     pool: Pool,
-    _: ApiKey,
     range_from: Optional[date] = Query(None, alias="from", description="Start of date range (YYYY-MM-DD)"),
     range_to: Optional[date] = Query(None, alias="to", description="End of date range (YYYY-MM-DD)"),
-):
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Max number of schedules to return"),
+    offset: int = Query(0, ge=0, description="Number of schedules to skip"),
+) -> List[ScheduleRead]:
     """Get all schedules. With from/to params, returns all schedules overlapping that range. Without, returns currently effective only."""
-    try:
-        return await schedule_service.get_all_schedules(pool, range_from, range_to)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener los horarios: {e}")
+    # ETag derived from MAX(updated_at)+COUNT(*): one cheap indexed query lets
+    # unchanged clients skip the full fetch and serialization with a 304.
+    etag = await schedule_service.get_schedules_etag(pool, range_from, range_to, limit, offset)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return await schedule_service.get_all_schedules(pool, range_from, range_to, limit, offset)
+
+
+@router.get("/summary", response_model=None, responses=RESPONSES_500)
+async def get_all_schedule_summaries(
+    pool: Pool,
+) -> List[ScheduleSummary]:
+    """Get a lightweight listing of all current schedules (metadata only, no day/extra/special payloads)."""
+    return await schedule_service.get_all_schedule_summaries(pool)
+
+
+@router.get("/export", response_model=None, responses=RESPONSES_500)
+async def export_all_schedules(pool: Pool) -> StreamingResponse:
+    """Stream all currently effective schedules as NDJSON (one schedule per line)."""
+    return StreamingResponse(
+        schedule_service.stream_all_schedules(pool),
+        media_type="application/x-ndjson",
+    )
 
 
-@router.get("/{device_id}/history", response_model=List[ScheduleRead], responses=RESPONSES_500)
+@router.get("/{device_id}/history", response_model=None, responses=RESPONSES_500)
 async def get_schedule_history(
     device_id: int,
     pool: Pool,
-    _: ApiKey,
-):
+) -> List[ScheduleRead]:
     """Get all schedules (history) for a specific device."""
-    try:
-        return await schedule_service.get_schedule_history(pool, device_id)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener historial: {e}")
+    return await schedule_service.get_schedule_history(pool, device_id)
 
 
-@router.get("/{device_id}", response_model=List[ScheduleRead], responses=RESPONSES_500)
+@router.get("/{device_id}", response_model=None, responses=RESPONSES_500)
 async def get_schedule(
     device_id: int,
     pool: Pool,
-    _: ApiKey,
     date_param: DateQuery = None,
     shift_type: OptionalShiftTypeQuery = None,
-):
+) -> List[ScheduleRead]:
     """Get schedules for a device. Returns all shift types when shiftType is omitted."""
-    try:
-        return await schedule_service.get_device_schedules(pool, device_id, target_date=date_param, shift_type=shift_type)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al obtener el horario: {e}")
+    return await schedule_service.get_device_schedules(pool, device_id, target_date=date_param, shift_type=shift_type)
 
 
-@router.delete("/{device_id}", response_model=ScheduleDeleteResponse, responses=RESPONSES_404_500)
+@router.delete("/{device_id}", response_model=None, responses=RESPONSES_404_500)
 async def delete_schedule(
     device_id: int,
     pool: Pool,
-    _: ApiKey,
     schedule_id: Annotated[Optional[int], Query(alias="scheduleId", description="Specific schedule ID to delete")] = None,
     shift_type: ShiftTypeQuery = "day",
-):
+) -> ScheduleDeleteResponse:
     """Delete a schedule for a device (current or by specific schedule ID)."""
-    try:
-        await schedule_service.delete_schedule(pool, device_id, schedule_id=schedule_id, shift_type=shift_type)
-        return ScheduleDeleteResponse(
-            message=f"Horario del dispositivo {device_id} eliminado correctamente"
-        )
-    except LookupError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al eliminar el horario: {e}")
+    await schedule_service.delete_schedule(pool, device_id, schedule_id=schedule_id, shift_type=shift_type)
+    return ScheduleDeleteResponse(
+        message=f"Horario del dispositivo {device_id} eliminado correctamente"
+    )
@@ -14,6 +14,7 @@ from .schedule import (
     ScheduleUpdate,
     SchedulePatch,
     ScheduleRead,
+    ScheduleSummary,
     ScheduleDeleteResponse,
     ErrorResponse,
 )
@@ -28,6 +29,7 @@ __all__ = [
     "ScheduleUpdate",
     "SchedulePatch",
     "ScheduleRead",
+    "ScheduleSummary",
     "ScheduleDeleteResponse",
     "ErrorResponse",
 ]
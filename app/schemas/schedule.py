@@ -327,6 +327,32 @@ class ScheduleRead(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class ScheduleSummary(BaseModel):
+    """Lightweight schedule listing entry (no JSONB payloads)."""
+
+    id: str = Field(..., description="Unique schedule ID")
+    device_id: int = Field(
+        ..., serialization_alias="deviceId", description="Device ID"
+    )
+    device_name: Optional[str] = Field(
+        None, serialization_alias="deviceName", description="Device name (from devices table)"
+    )
+    shift_type: str = Field(
+        default="day", serialization_alias="shiftType", description=SHIFT_TYPE_DESCRIPTION
+    )
+    valid_from: date = Field(
+        ..., serialization_alias="validFrom", description="Start date of schedule validity"
+    )
+    valid_to: Optional[date] = Field(
+        None, serialization_alias="validTo", description="End date of schedule validity"
+    )
+    updated_at: Optional[datetime] = Field(
+        None, serialization_alias="updatedAt", description="Last update timestamp"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class ScheduleDeleteResponse(BaseModel):
     """Schema for schedule deletion responses."""
 
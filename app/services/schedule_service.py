@@ -6,12 +6,15 @@ Raises ValueError for validation errors and LookupError for not-found.
 The router maps these to HTTP status codes.
 """
 
-import json
 import re
 from datetime import date, datetime, time
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from time import monotonic
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import asyncpg
+import hashlib
+import orjson
 
 from ..models.schedule import (
     Break,
@@ -24,7 +27,6 @@ from ..models.schedule import (
 )
 from ..repositories.crud import schedule_crud
 from ..schemas.schedule import (
-    AllScheduleStatsResponse,
     BreakSchema,
     DayScheduleSchema,
     ExtraHourSchema,
@@ -33,9 +35,8 @@ from ..schemas.schedule import (
     ScheduleDeleteResponse,
     SchedulePatch,
     ScheduleRead,
-    ScheduleStatsSchema,
+    ScheduleSummary,
     ScheduleUpdate,
-    SingleScheduleStatsResponse,
     SpecialDaySchema,
     WorkHoursSchema,
 )
@@ -49,14 +50,13 @@ _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _INVALID_DATE_FMT = "Formato de fecha inválido. Use YYYY-MM-DD"
 
 
+# There are at most 1440 distinct HH:MM strings, so repeated values hit
+# the cache instead of re-running strptime's format parsing.
+@lru_cache(maxsize=2048)
 def _parse_time_string(time_str: str) -> time:
     return datetime.strptime(time_str, "%H:%M").time()
 
 
-def _time_to_minutes(time_obj: time) -> int:
-    return time_obj.hour * 60 + time_obj.minute
-
-
 def _serialize_day_schedules(schedule_dict: Dict[str, DayScheduleSchema]) -> str:
     """Convert DayScheduleSchema dict to JSON string for DB storage."""
     result = {}
@@ -70,7 +70,7 @@ def _serialize_day_schedules(schedule_dict: Dict[str, DayScheduleSchema]) -> str
                 for b in ds.breaks
             ]
         result[day] = day_data
-    return json.dumps(result)
+    return orjson.dumps(result).decode()
 
 
 def _serialize_extra_hours(
@@ -78,9 +78,9 @@ def _serialize_extra_hours(
 ) -> Optional[str]:
     if not extra_hours:
         return None
-    return json.dumps(
+    return orjson.dumps(
         {day: [h.model_dump() for h in hours] for day, hours in extra_hours.items()}
-    )
+    ).decode()
 
 
 def _serialize_special_days(
@@ -88,22 +88,57 @@ def _serialize_special_days(
 ) -> Optional[str]:
     if not special_days:
         return None
-    return json.dumps(
+    return orjson.dumps(
         {date_str: sd.model_dump(by_alias=True) for date_str, sd in special_days.items()}
-    )
+    ).decode()
+
+
+# In-process TTL cache for read-heavy lookups that change on human
+# timescales (by-day listings, special days). A hit is a dict lookup —
+# no pool checkout, no query, no row decoding. Writes clear the whole
+# cache; it is tiny and writes are rare, so targeted eviction is not
+# worth the bookkeeping.
+_READ_CACHE: Dict[str, tuple] = {}
+_READ_CACHE_TTL = 30.0
+
+
+def _cache_get(key: str) -> Optional[Any]:
+    entry = _READ_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if monotonic() >= expires_at:
+        del _READ_CACHE[key]
+        return None
+    return value
+
+
+def _cache_put(key: str, value: Any) -> None:
+    _READ_CACHE[key] = (monotonic() + _READ_CACHE_TTL, value)
+
+
+def _invalidate_read_cache() -> None:
+    _READ_CACHE.clear()
 
 
 def _load_jsonb(data) -> dict:
     """Parse a JSONB value that may be a string or already a dict."""
-    return json.loads(data) if isinstance(data, str) else data
+    return orjson.loads(data) if isinstance(data, (str, bytes)) else data
+
+
+def _construct_break(b: dict) -> BreakSchema:
+    return BreakSchema.model_construct(
+        start=b["start"],
+        duration_minutes=b.get("durationMinutes", b.get("duration_minutes")),
+    )
 
 
 def _parse_breaks_schema(cfg: dict) -> Optional[List[BreakSchema]]:
     """Parse breaks from a day config dict, handling legacy single-object format."""
     if cfg.get("breaks"):
-        return [BreakSchema(**b) for b in cfg["breaks"]]
+        return [_construct_break(b) for b in cfg["breaks"]]
     if cfg.get("break"):
-        return [BreakSchema(**cfg["break"])]
+        return [_construct_break(cfg["break"])]
     return None
 
 
@@ -120,8 +155,10 @@ def _parse_special_days_schema(sd_data: dict) -> Dict[str, SpecialDaySchema]:
     """Parse special days JSONB into SpecialDaySchema instances."""
     result = {}
     for date_str, sd in sd_data.items():
-        work_hours = WorkHoursSchema(**sd["workHours"]) if sd.get("workHours") else None
-        result[date_str] = SpecialDaySchema(
+        work_hours = (
+            WorkHoursSchema.model_construct(**sd["workHours"]) if sd.get("workHours") else None
+        )
+        result[date_str] = SpecialDaySchema.model_construct(
             name=sd["name"],
             type=sd["type"],
             work_hours=work_hours,
@@ -148,11 +185,17 @@ def _parse_special_days_model(sd_data: dict) -> Dict[str, SpecialDay]:
 
 
 def _build_schedule_read(db_record: dict) -> ScheduleRead:
-    """Build a ScheduleRead from a database record."""
+    """Build a ScheduleRead from a database record.
+
+    The row came out of our own DB and was validated on write, so the
+    schemas are assembled with model_construct to skip pydantic's
+    per-field validation on the read hot path. Client input (POST/PUT/
+    PATCH bodies) still goes through full validation at ingress.
+    """
     day_schedules_data = _load_jsonb(db_record["day_schedules"])
     day_schedules_dict = {
-        day: DayScheduleSchema(
-            work_hours=WorkHoursSchema(**cfg["workHours"]),
+        day: DayScheduleSchema.model_construct(
+            work_hours=WorkHoursSchema.model_construct(**cfg["workHours"]),
             breaks=_parse_breaks_schema(cfg),
         )
         for day, cfg in day_schedules_data.items()
@@ -162,7 +205,7 @@ def _build_schedule_read(db_record: dict) -> ScheduleRead:
     if db_record["extra_hours"]:
         eh_data = _load_jsonb(db_record["extra_hours"])
         extra_hours_dict = {
-            day: [ExtraHourSchema(**h) for h in hours]
+            day: [ExtraHourSchema.model_construct(**h) for h in hours]
             for day, hours in eh_data.items()
         }
 
@@ -172,7 +215,7 @@ def _build_schedule_read(db_record: dict) -> ScheduleRead:
             _load_jsonb(db_record["special_days"])
         )
 
-    return ScheduleRead(
+    return ScheduleRead.model_construct(
         id=str(db_record["id"]),
         device_id=db_record["device_id"],
         device_name=db_record.get("device_name"),
@@ -182,7 +225,7 @@ def _build_schedule_read(db_record: dict) -> ScheduleRead:
         special_days=special_days_dict,
         valid_from=db_record["valid_from"],
         valid_to=db_record.get("valid_to"),
-        metadata=MetadataSchema(
+        metadata=MetadataSchema.model_construct(
             created_at=db_record["created_at"],
             version=db_record["version"],
             source=db_record["source"],
@@ -215,8 +258,9 @@ def _deduct_breaks(
     """Calculate total break minutes to deduct from elapsed work time."""
     deduction = 0
     for b in breaks_data:
+        bt = _parse_time_string(b["start"])
         b_start = _normalize_minute(
-            _time_to_minutes(_parse_time_string(b["start"])),
+            bt.hour * 60 + bt.minute,
             work_start_minutes,
             crosses_midnight,
         )
@@ -228,28 +272,49 @@ def _deduct_breaks(
     return deduction
 
 
-def _calculate_work_hours_usage(db_schedule: dict, current_time: datetime) -> dict:
-    """Calculate work hours usage statistics for a schedule (handles cross-midnight)."""
-    current_day = current_time.strftime("%A").lower()
-    current_time_obj = current_time.time()
-    current_time_str = current_time_obj.strftime("%H:%M")
+# Template for the common "device inactive today" case (weekends,
+# off-hours): only device_id and current_time vary, so the constant part
+# is shared instead of rebuilt per device in the /stats/all loop.
+_ZERO_STATS = {
+    "schedule_start": "00:00",
+    "schedule_end": "00:00",
+    "hours_used": 0.0,
+    "total_work_hours": 0.0,
+    "usage_percentage": 0.0,
+}
+
+
+def _calculate_work_hours_usage(
+    db_schedule: dict, current_day: str, current_time_str: str, current_minutes: int,
+) -> dict:
+    """Calculate work hours usage statistics for a schedule (handles cross-midnight).
 
+    The caller passes the precomputed day name, HH:MM string and minute
+    count so the per-device loop in get_all_stats does not redo them.
+    """
     day_schedules_data = db_schedule["day_schedules"]
     if isinstance(day_schedules_data, str):
-        day_schedules_data = json.loads(day_schedules_data)
+        day_schedules_data = orjson.loads(day_schedules_data)
 
     if current_day not in day_schedules_data:
         return {
+            **_ZERO_STATS,
             "device_id": db_schedule["device_id"],
-            "schedule_start": "00:00",
-            "schedule_end": "00:00",
             "current_time": current_time_str,
-            "hours_used": 0.0,
-            "total_work_hours": 0.0,
-            "usage_percentage": 0.0,
         }
 
-    today_schedule = day_schedules_data[current_day]
+    return _calculate_day_usage(
+        db_schedule["device_id"],
+        day_schedules_data[current_day],
+        current_time_str,
+        current_minutes,
+    )
+
+
+def _calculate_day_usage(
+    device_id: int, today_schedule: dict, current_time_str: str, current_minutes: int,
+) -> dict:
+    """Compute usage stats from a single day's config (already extracted)."""
     work_start = _parse_time_string(today_schedule["workHours"]["start"])
     work_end = _parse_time_string(today_schedule["workHours"]["end"])
 
@@ -257,8 +322,8 @@ def _calculate_work_hours_usage(db_schedule: dict, current_time: datetime) -> di
 
     total_break_duration = sum(b["durationMinutes"] for b in breaks_data)
 
-    work_start_minutes = _time_to_minutes(work_start)
-    work_end_minutes = _time_to_minutes(work_end)
+    work_start_minutes = work_start.hour * 60 + work_start.minute
+    work_end_minutes = work_end.hour * 60 + work_end.minute
 
     # Handle cross-midnight schedules (e.g. 22:00→06:00)
     crosses_midnight = work_end_minutes <= work_start_minutes
@@ -268,7 +333,6 @@ def _calculate_work_hours_usage(db_schedule: dict, current_time: datetime) -> di
     total_work_minutes = work_end_minutes - work_start_minutes - total_break_duration
     total_work_hours = total_work_minutes / 60.0
 
-    current_minutes = _time_to_minutes(current_time_obj)
     current_norm = _normalize_minute(current_minutes, work_start_minutes, crosses_midnight)
 
     if current_norm < work_start_minutes:
@@ -290,9 +354,9 @@ def _calculate_work_hours_usage(db_schedule: dict, current_time: datetime) -> di
     usage_percentage = min(100.0, max(0.0, usage_percentage))
 
     return {
-        "device_id": db_schedule["device_id"],
-        "schedule_start": work_start.strftime("%H:%M"),
-        "schedule_end": work_end.strftime("%H:%M"),
+        "device_id": device_id,
+        "schedule_start": f"{work_start.hour:02d}:{work_start.minute:02d}",
+        "schedule_end": f"{work_end.hour:02d}:{work_end.minute:02d}",
         "current_time": current_time_str,
         "hours_used": round(hours_used, 2),
         "total_work_hours": round(total_work_hours, 2),
@@ -300,6 +364,30 @@ def _calculate_work_hours_usage(db_schedule: dict, current_time: datetime) -> di
     }
 
 
+def _serialize_payload_fields(data) -> Dict[str, Any]:
+    """Serialize the JSONB payload and metadata fields shared by create and update."""
+    return {
+        "day_schedules": _serialize_day_schedules(data.schedule),
+        "extra_hours": _serialize_extra_hours(data.extra_hours),
+        "special_days": _serialize_special_days(data.special_days),
+        "version": data.metadata.version if data.metadata else "1.0",
+        "source": data.metadata.source if data.metadata else "ui",
+    }
+
+
+def _stats_wire(stats: dict) -> dict:
+    """Map a stats dict to its camelCase wire form without a pydantic pass."""
+    return {
+        "deviceId": stats["device_id"],
+        "scheduleStart": stats["schedule_start"],
+        "scheduleEnd": stats["schedule_end"],
+        "currentTime": stats["current_time"],
+        "hoursUsed": stats["hours_used"],
+        "totalWorkHours": stats["total_work_hours"],
+        "usagePercentage": stats["usage_percentage"],
+    }
+
+
 def _parse_break(data: dict) -> Break:
     """Parse a break dict from JSONB (camelCase) into a Break model (snake_case)."""
     return Break(
@@ -374,19 +462,24 @@ class ScheduleService:
         schedule_data = {
             "device_id": device_id,
             "shift_type": data.shift_type,
-            "day_schedules": _serialize_day_schedules(data.schedule),
-            "extra_hours": _serialize_extra_hours(data.extra_hours),
-            "special_days": _serialize_special_days(data.special_days),
             "valid_from": data.valid_from,
             "valid_to": data.valid_to,
-            "version": data.metadata.version if data.metadata else "1.0",
-            "source": data.metadata.source if data.metadata else "ui",
+            **_serialize_payload_fields(data),
         }
 
-        if schedule_data["valid_to"] is not None:
-            schedule_id = await schedule_crud.create_with_split(pool, schedule_data)
-        else:
-            schedule_id = await schedule_crud.create_with_auto_close(pool, schedule_data)
+        try:
+            if schedule_data["valid_to"] is not None:
+                schedule_id = await schedule_crud.create_with_split(pool, schedule_data)
+            else:
+                schedule_id = await schedule_crud.create_with_auto_close(pool, schedule_data)
+        except asyncpg.exceptions.ExclusionViolationError:
+            # La restricción de exclusión GiST detecta solapamientos de forma
+            # atómica; un conflicto bajo concurrencia llega aquí como 400.
+            raise ValueError(
+                "El horario se solapa con otro existente para el dispositivo"
+            )
+
+        _invalidate_read_cache()
 
         db_record = await schedule_crud.get_by_id(pool, schedule_id)
         if not db_record:
@@ -436,32 +529,29 @@ class ScheduleService:
         pool: asyncpg.Pool, device_id: int, data: ScheduleUpdate,
         target_date: Optional[date] = None, shift_type: str = "day",
     ) -> ScheduleRead:
-        if target_date:
-            existing = await schedule_crud.get_by_device_id_and_date(pool, device_id, target_date, shift_type)
-        else:
-            existing = await schedule_crud.get_current_by_device_id(pool, device_id, shift_type)
-        if not existing:
-            raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
-
-        schedule_id = existing["id"]
-        update_data: Dict[str, Any] = {
-            "day_schedules": _serialize_day_schedules(data.schedule),
-            "extra_hours": _serialize_extra_hours(data.extra_hours),
-            "special_days": _serialize_special_days(data.special_days),
-            "version": data.metadata.version if data.metadata else "1.0",
-            "source": data.metadata.source if data.metadata else "ui",
-        }
-
-        if data.shift_type is not None:
-            update_data["shift_type"] = data.shift_type
-        if data.valid_from is not None:
-            update_data["valid_from"] = data.valid_from
-        if data.valid_to is not None:
-            update_data["valid_to"] = data.valid_to
-
-        await schedule_crud.partial_update(pool, schedule_id, update_data)
-
-        db_record = await schedule_crud.get_by_id(pool, schedule_id)
+        # Una sola conexión y transacción para el ciclo leer-validar-escribir:
+        # evita re-adquirir del pool por sentencia y hace atómico el conjunto.
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                if target_date:
+                    existing = await schedule_crud.get_by_device_id_and_date(conn, device_id, target_date, shift_type)
+                else:
+                    existing = await schedule_crud.get_current_by_device_id(conn, device_id, shift_type)
+                if not existing:
+                    raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
+
+                schedule_id = existing["id"]
+                update_data: Dict[str, Any] = _serialize_payload_fields(data)
+
+                if data.shift_type is not None:
+                    update_data["shift_type"] = data.shift_type
+                if data.valid_from is not None:
+                    update_data["valid_from"] = data.valid_from
+                if data.valid_to is not None:
+                    update_data["valid_to"] = data.valid_to
+
+                db_record = await schedule_crud.partial_update(conn, schedule_id, update_data)
+                _invalidate_read_cache()
         return _build_schedule_read(db_record)
 
     @staticmethod
@@ -469,44 +559,48 @@ class ScheduleService:
         pool: asyncpg.Pool, device_id: int, data: SchedulePatch,
         target_date: Optional[date] = None, shift_type: str = "day",
     ) -> ScheduleRead:
-        if target_date:
-            existing = await schedule_crud.get_by_device_id_and_date(pool, device_id, target_date, shift_type)
-        else:
-            existing = await schedule_crud.get_current_by_device_id(pool, device_id, shift_type)
-        if not existing:
-            raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
-
-        schedule_id = existing["id"]
-        update_data: Dict[str, Any] = {}
-
-        if data.shift_type is not None:
-            update_data["shift_type"] = data.shift_type
-
-        if data.schedule is not None:
-            update_data["day_schedules"] = _serialize_day_schedules(data.schedule)
-
-        if data.extra_hours is not None:
-            update_data["extra_hours"] = _serialize_extra_hours(data.extra_hours)
-
-        if data.special_days is not None:
-            update_data["special_days"] = _serialize_special_days(data.special_days)
-
-        if data.valid_from is not None:
-            update_data["valid_from"] = data.valid_from
-
-        if data.valid_to is not None:
-            update_data["valid_to"] = data.valid_to
-
-        if data.metadata:
-            if data.metadata.version:
-                update_data["version"] = data.metadata.version
-            if data.metadata.source:
-                update_data["source"] = data.metadata.source
-
-        if update_data:
-            await schedule_crud.partial_update(pool, schedule_id, update_data)
-
-        db_record = await schedule_crud.get_by_id(pool, schedule_id)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                if target_date:
+                    existing = await schedule_crud.get_by_device_id_and_date(conn, device_id, target_date, shift_type)
+                else:
+                    existing = await schedule_crud.get_current_by_device_id(conn, device_id, shift_type)
+                if not existing:
+                    raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
+
+                schedule_id = existing["id"]
+                update_data: Dict[str, Any] = {}
+
+                if data.shift_type is not None:
+                    update_data["shift_type"] = data.shift_type
+
+                if data.schedule is not None:
+                    update_data["day_schedules"] = _serialize_day_schedules(data.schedule)
+
+                if data.extra_hours is not None:
+                    update_data["extra_hours"] = _serialize_extra_hours(data.extra_hours)
+
+                if data.special_days is not None:
+                    update_data["special_days"] = _serialize_special_days(data.special_days)
+
+                if data.valid_from is not None:
+                    update_data["valid_from"] = data.valid_from
+
+                if data.valid_to is not None:
+                    update_data["valid_to"] = data.valid_to
+
+                if data.metadata:
+                    if data.metadata.version:
+                        update_data["version"] = data.metadata.version
+                    if data.metadata.source:
+                        update_data["source"] = data.metadata.source
+
+                if update_data:
+                    db_record = await schedule_crud.partial_update(conn, schedule_id, update_data)
+                    _invalidate_read_cache()
+                else:
+                    # No-op patch: the row we already read is the current state.
+                    db_record = existing
         return _build_schedule_read(db_record)
 
     @staticmethod
@@ -514,20 +608,81 @@ class ScheduleService:
         pool: asyncpg.Pool,
         range_from: Optional[date] = None,
         range_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[ScheduleRead]:
         if range_from and range_to:
-            db_records = await schedule_crud.get_all_in_range(pool, range_from, range_to)
+            db_records = await schedule_crud.get_all_in_range(pool, range_from, range_to, limit, offset)
         else:
-            db_records = await schedule_crud.get_all_current(pool)
+            db_records = await schedule_crud.get_all_current(pool, limit, offset)
         return [_build_schedule_read(r) for r in db_records]
 
+    @staticmethod
+    async def get_schedules_etag(pool: asyncpg.Pool, *parts: Any) -> str:
+        """Derive a weak listing ETag from the table's change marker plus query parts.
+
+        The default listing filters on valid_range @> CURRENT_DATE, so the
+        current date is part of the seed: schedules can expire or become
+        effective at midnight without any write, and the ETag must rotate
+        with them.
+        """
+        row = await schedule_crud.get_listing_version(pool)
+        seed = (
+            f"{date.today().isoformat()}|{row['last_updated']}|{row['total']}|"
+            + "|".join(str(p) for p in parts)
+        )
+        return 'W/"' + hashlib.blake2b(seed.encode(), digest_size=16).hexdigest() + '"'
+
+    @staticmethod
+    async def get_all_schedule_summaries(pool: asyncpg.Pool) -> List[ScheduleSummary]:
+        db_records = await schedule_crud.get_all_current_summary(pool)
+        return [
+            ScheduleSummary.model_construct(
+                id=str(r["id"]),
+                device_id=r["device_id"],
+                device_name=r["device_name"],
+                shift_type=r["shift_type"],
+                valid_from=r["valid_from"],
+                valid_to=r["valid_to"],
+                updated_at=r["updated_at"],
+            )
+            for r in db_records
+        ]
+
+    @staticmethod
+    async def stream_all_schedules(
+        pool: asyncpg.Pool, prefetch: int = 500,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream all currently effective schedules as NDJSON lines.
+
+        Rows come off a server-side cursor, so only `prefetch` rows are held
+        in memory at a time instead of the full listing.
+        """
+        async for row in schedule_crud.iter_all_current(pool, prefetch=prefetch):
+            payload = _build_schedule_read(row).model_dump(by_alias=True, mode="json")
+            yield orjson.dumps(payload) + b"\n"
+
     @staticmethod
     async def get_schedules_by_day(pool: asyncpg.Pool, day: str) -> List[ScheduleRead]:
         day_lower = day.lower()
         if day_lower not in VALID_DAYS:
             raise ValueError("Día inválido. Use: monday, tuesday, etc.")
+        cache_key = f"day:{day_lower}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
         db_records = await schedule_crud.get_by_day(pool, day_lower)
-        return [_build_schedule_read(r) for r in db_records]
+        result = [_build_schedule_read(r) for r in db_records]
+        _cache_put(cache_key, result)
+        return result
+
+    @staticmethod
+    async def get_device_names_by_day(pool: asyncpg.Pool, day: str) -> List[str]:
+        day_lower = day.lower()
+        if day_lower not in VALID_DAYS:
+            raise ValueError("Día inválido. Use: monday, tuesday, etc.")
+        return await schedule_crud.get_device_names_by_day(pool, day_lower)
 
     @staticmethod
     async def delete_schedule(
@@ -540,45 +695,85 @@ class ScheduleService:
             deleted = await schedule_crud.delete_current_by_device_id(pool, device_id, shift_type)
         if not deleted:
             raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
+        _invalidate_read_cache()
         return True
 
     @staticmethod
-    async def get_all_stats(pool: asyncpg.Pool) -> AllScheduleStatsResponse:
+    async def get_all_stats(pool: asyncpg.Pool) -> Dict[str, Any]:
+        """Build the all-devices stats payload as a plain dict (no pydantic pass)."""
         current_time = datetime.now()
-        db_records = await schedule_crud.get_all_current(pool)
+        current_day = VALID_DAYS[current_time.weekday()]
+        current_time_str = f"{current_time.hour:02d}:{current_time.minute:02d}"
+        current_minutes = current_time.hour * 60 + current_time.minute
+        rows = await schedule_crud.get_stats_projection(pool, current_day)
+
+        devices = []
+        for row in rows:
+            today = row["today"]
+            if today is None:
+                stats = {
+                    **_ZERO_STATS,
+                    "device_id": row["device_id"],
+                    "current_time": current_time_str,
+                }
+            else:
+                if isinstance(today, (str, bytes)):
+                    today = orjson.loads(today)
+                stats = _calculate_day_usage(
+                    row["device_id"], today, current_time_str, current_minutes
+                )
+            devices.append(_stats_wire(stats))
 
-        device_stats = []
-        for rec in db_records:
-            stats = _calculate_work_hours_usage(rec, current_time)
-            device_stats.append(ScheduleStatsSchema(**stats))
-
-        return AllScheduleStatsResponse(
-            request_time=current_time.strftime("%H:%M"),
-            devices=device_stats,
-        )
+        return {"requestTime": current_time_str, "devices": devices}
 
     @staticmethod
     async def get_device_stats(
         pool: asyncpg.Pool, device_id: int, shift_type: str = "day",
-    ) -> SingleScheduleStatsResponse:
+    ) -> Dict[str, Any]:
+        """Build the single-device stats payload as a plain dict (no pydantic pass)."""
         current_time = datetime.now()
+        current_day = VALID_DAYS[current_time.weekday()]
+        current_time_str = f"{current_time.hour:02d}:{current_time.minute:02d}"
+        current_minutes = current_time.hour * 60 + current_time.minute
         db_record = await schedule_crud.get_current_by_device_id(pool, device_id, shift_type)
         if not db_record:
             raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
 
-        stats = _calculate_work_hours_usage(db_record, current_time)
-        device_stats = ScheduleStatsSchema(**stats)
-
-        return SingleScheduleStatsResponse(
-            request_time=current_time.strftime("%H:%M"),
-            device_stats=device_stats,
-        )
+        return {
+            "requestTime": current_time_str,
+            "deviceStats": _stats_wire(
+                _calculate_work_hours_usage(db_record, current_day, current_time_str, current_minutes)
+            ),
+        }
 
     @staticmethod
     async def get_special_days(
         pool: asyncpg.Pool, device_id: int, shift_type: str = "day",
     ) -> Dict[str, Any]:
+        cache_key = f"special:{device_id}:{shift_type}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
         result = await schedule_crud.get_special_days(pool, device_id, shift_type)
+        if result is None:
+            raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
+        _cache_put(cache_key, result)
+        return result
+
+    @staticmethod
+    async def get_special_days_in_range(
+        pool: asyncpg.Pool,
+        device_id: int,
+        from_date: str,
+        to_date: str,
+        shift_type: str = "day",
+    ) -> Dict[str, Any]:
+        if not _DATE_RE.match(from_date) or not _DATE_RE.match(to_date):
+            raise ValueError(_INVALID_DATE_FMT)
+
+        result = await schedule_crud.get_special_days_in_range(
+            pool, device_id, from_date, to_date, shift_type
+        )
         if result is None:
             raise LookupError(f"Schedule for device_id={device_id} shift_type={shift_type} not found")
         return result
@@ -587,63 +782,65 @@ class ScheduleService:
     async def add_special_day(
         pool: asyncpg.Pool,
         device_id: int,
-        date_str: str,
+        target_date: date,
         special_day: SpecialDaySchema,
         shift_type: str = "day",
     ) -> ScheduleRead:
-        if not _DATE_RE.match(date_str):
-            raise ValueError(_INVALID_DATE_FMT)
+        date_str = target_date.isoformat()
 
-        db_record = await schedule_crud.get_current_by_device_id(pool, device_id, shift_type)
-        if not db_record:
-            raise LookupError(f"Schedule for device_id={device_id} not found")
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                db_record = await schedule_crud.get_current_by_device_id(conn, device_id, shift_type)
+                if not db_record:
+                    raise LookupError(f"Schedule for device_id={device_id} not found")
 
-        schedule_id = db_record["id"]
+                schedule_id = db_record["id"]
 
-        sd_data = db_record.get("special_days")
-        if sd_data:
-            special_days = json.loads(sd_data) if isinstance(sd_data, str) else sd_data
-        else:
-            special_days = {}
-
-        special_days[date_str] = special_day.model_dump(by_alias=True)
+                sd_data = db_record.get("special_days")
+                if sd_data:
+                    special_days = _load_jsonb(sd_data)
+                else:
+                    special_days = {}
 
-        await schedule_crud.partial_update(
-            pool, schedule_id, {"special_days": json.dumps(special_days)}
-        )
+                special_days[date_str] = special_day.model_dump(by_alias=True)
 
-        updated = await schedule_crud.get_by_id(pool, schedule_id)
+                updated = await schedule_crud.partial_update(
+                    conn, schedule_id, {"special_days": orjson.dumps(special_days).decode()}
+                )
+                _invalidate_read_cache()
         return _build_schedule_read(updated)
 
     @staticmethod
     async def delete_special_day(
-        pool: asyncpg.Pool, device_id: int, date_str: str,
+        pool: asyncpg.Pool, device_id: int, target_date: date,
         shift_type: str = "day",
     ) -> ScheduleDeleteResponse:
-        if not _DATE_RE.match(date_str):
-            raise ValueError(_INVALID_DATE_FMT)
+        date_str = target_date.isoformat()
 
-        db_record = await schedule_crud.get_current_by_device_id(pool, device_id, shift_type)
-        if not db_record:
-            raise LookupError(f"Schedule for device_id={device_id} not found")
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                db_record = await schedule_crud.get_current_by_device_id(conn, device_id, shift_type)
+                if not db_record:
+                    raise LookupError(f"Schedule for device_id={device_id} not found")
 
-        schedule_id = db_record["id"]
+                schedule_id = db_record["id"]
 
-        sd_data = db_record.get("special_days")
-        if not sd_data:
-            raise LookupError("No hay días especiales para este dispositivo")
+                sd_data = db_record.get("special_days")
+                if not sd_data:
+                    raise LookupError("No hay días especiales para este dispositivo")
 
-        special_days = json.loads(sd_data) if isinstance(sd_data, str) else sd_data
-        if date_str not in special_days:
-            raise LookupError("Día especial no encontrado")
+                special_days = _load_jsonb(sd_data)
+                if date_str not in special_days:
+                    raise LookupError("Día especial no encontrado")
 
-        del special_days[date_str]
+                del special_days[date_str]
 
-        await schedule_crud.partial_update(
-            pool,
-            schedule_id,
-            {"special_days": json.dumps(special_days) if special_days else None},
-        )
+                await schedule_crud.partial_update(
+                    conn,
+                    schedule_id,
+                    {"special_days": orjson.dumps(special_days).decode() if special_days else None},
+                )
+                _invalidate_read_cache()
 
         return ScheduleDeleteResponse(
             message=f"Día especial {date_str} eliminado para device_id={device_id}"
@@ -651,14 +848,9 @@ class ScheduleService:
 
     @staticmethod
     async def get_effective_schedule(
-        pool: asyncpg.Pool, device_id: int, date_str: str,
+        pool: asyncpg.Pool, device_id: int, target_date: date,
         shift_type: str = "day",
     ) -> Optional[DayScheduleSchema]:
-        if not _DATE_RE.match(date_str):
-            raise ValueError(_INVALID_DATE_FMT)
-
-        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
         db_record = await schedule_crud.get_by_device_id_and_date(pool, device_id, target_date, shift_type)
         if not db_record:
             raise LookupError(f"Schedule for device_id={device_id} not found")
@@ -0,0 +1,13 @@
+-- Migration 003: GIN index on day_schedules for get_by_day
+--
+-- get_by_day filters with `day_schedules ? $1`; without an index this is a
+-- sequential scan over every schedule row. A GIN index with the default
+-- jsonb_ops operator class supports the `?` key-existence operator directly.
+-- (jsonb_path_ops deliberately does NOT support `?` — it only indexes paths
+-- for `@>` containment — so the default opclass is required here.)
+--
+-- special_days already has an equivalent GIN index (idx_device_schedules_special_days).
+--
+-- Run CONCURRENTLY on live deployments to avoid blocking writes:
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_device_schedules_day_schedules
+    ON device_schedules USING GIN (day_schedules);
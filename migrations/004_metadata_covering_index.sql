@@ -0,0 +1,13 @@
+-- Migration 004: Covering index for metadata-only current-schedule lookups
+--
+-- The per-device lookup is the hottest query in the API. The JSONB columns
+-- are too large to INCLUDE, so queries that return them still visit the heap,
+-- but callers that only need schedule metadata (validity window, version,
+-- source, timestamps) can be served entirely from the index tuple — a true
+-- index-only scan. get_current_metadata_by_device_id selects exactly the
+-- covered columns.
+--
+-- Run CONCURRENTLY on live deployments to avoid blocking writes:
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_device_schedules_metadata_cover
+    ON device_schedules (device_id, shift_type)
+    INCLUDE (id, valid_range, valid_from, valid_to, version, source, created_at, updated_at);
@@ -0,0 +1,12 @@
+-- Migration 005: Composite GiST index for per-device date lookups
+--
+-- The hottest queries filter on device_id + shift_type + valid_range @> date.
+-- The existing indexes cover (device_id, shift_type) via B-tree and
+-- valid_range via GiST separately, forcing a bitmap combine. A single
+-- composite GiST index (btree_gist provides the scalar opclasses) answers
+-- the whole predicate with one index scan.
+--
+-- Requires: CREATE EXTENSION btree_gist (already enabled by init_db).
+-- Run CONCURRENTLY on live deployments to avoid blocking writes:
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_device_schedules_device_range
+    ON device_schedules USING gist (device_id, shift_type, valid_range);
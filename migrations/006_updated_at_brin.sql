@@ -0,0 +1,9 @@
+-- Migration 006: BRIN index on updated_at for time-ordered listings
+--
+-- updated_at is effectively monotonically increasing (rows are appended and
+-- touched in time order), which is the ideal case for BRIN: block-range
+-- summaries give cheap `updated_at > $1` range scans at a fraction of a
+-- B-tree's size and cache footprint. Useful for admin/sync consumers that
+-- paginate by modification time.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_device_schedules_updated_at_brin
+    ON device_schedules USING brin (updated_at) WITH (pages_per_range = 32);
@@ -0,0 +1,9 @@
+-- Migration 007: Partial index for open-ended (indefinite) schedules
+--
+-- Most devices have exactly one open-ended schedule (valid_to IS NULL) at any
+-- time, and the auto-close path looks those rows up on every create. A small
+-- partial B-tree over just the open-ended subset serves that probe from a
+-- handful of pages instead of walking the full (device_id, shift_type) index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_device_schedules_open_ended
+    ON device_schedules (device_id, shift_type)
+    WHERE valid_to IS NULL;
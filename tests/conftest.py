@@ -6,6 +6,7 @@ and sample data factories for consistent test data.
 """
 
 import json
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from typing import Any, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock
@@ -13,7 +14,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.core.dependencies import get_db_pool, verify_api_key
+from app.core.config import settings
+from app.core.dependencies import get_db_pool
 from app.main import app
 
 
@@ -98,6 +100,23 @@ def make_db_record(
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    """Pin the API key the auth middleware checks, so the suite does not
+    depend on an API_KEY variable in the ambient environment."""
+    monkeypatch.setattr(settings, "API_KEY", "test")
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    """Keep the service-layer TTL cache from leaking state between tests."""
+    from app.services.schedule_service import _READ_CACHE
+
+    _READ_CACHE.clear()
+    yield
+    _READ_CACHE.clear()
+
+
 @pytest.fixture
 def sample_record():
     """A basic schedule DB record for device 1 (Mon-Fri 08-17)."""
@@ -133,21 +152,40 @@ def sample_record_with_special_days():
     )
 
 
+def make_mock_pool(conn: Optional[AsyncMock] = None) -> AsyncMock:
+    """Mock asyncpg.Pool whose acquire() yields a connection with a no-op transaction."""
+    if conn is None:
+        conn = AsyncMock()
+    pool = AsyncMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield conn
+
+    @asynccontextmanager
+    async def _transaction():
+        yield
+
+    pool.acquire = _acquire
+    conn.transaction = _transaction
+    return pool
+
+
 @pytest.fixture
 def mock_pool():
-    """An AsyncMock standing in for asyncpg.Pool."""
-    return AsyncMock()
+    """A mock standing in for asyncpg.Pool (acquire() works as a context manager)."""
+    return make_mock_pool()
 
 
 @pytest.fixture
 def client(mock_pool):
-    """httpx AsyncClient with dependency overrides (no real DB / no auth)."""
-    app.dependency_overrides[verify_api_key] = lambda: None
+    """httpx AsyncClient with a mocked DB pool and a valid API key header."""
     app.dependency_overrides[get_db_pool] = lambda: mock_pool
 
     yield AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test/shifts-api/v1",
+        headers={"X-API-Key": "test"},
     )
 
     app.dependency_overrides.clear()
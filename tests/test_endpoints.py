@@ -7,12 +7,13 @@ The service layer's CRUD calls are patched to return synthetic data.
 
 from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.core.dependencies import get_db_pool, verify_api_key
+from app.core.dependencies import get_db_pool
 from app.main import app
-from tests.conftest import make_db_record, make_extra_hours_json, make_special_days_json
+from tests.conftest import make_db_record, make_extra_hours_json, make_mock_pool, make_special_days_json
 
 CRUD_PATH = "app.services.schedule_service.schedule_crud"
 BASE = "http://test/shifts-api/v1/schedules"
@@ -20,17 +21,17 @@ BASE = "http://test/shifts-api/v1/schedules"
 
 @pytest.fixture
 def mock_pool():
-    return AsyncMock()
+    return make_mock_pool()
 
 
 @pytest.fixture
 async def client(mock_pool):
-    app.dependency_overrides[verify_api_key] = lambda: None
     app.dependency_overrides[get_db_pool] = lambda: mock_pool
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url=BASE,
+        headers={"X-API-Key": "test"},
     ) as c:
         yield c
 
@@ -302,8 +303,7 @@ class TestUpdateSchedule:
         existing = make_db_record(device_id=1)
         updated = make_db_record(device_id=1, days=["monday"])
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
             resp = await client.put(
                 "/1",
                 json={
@@ -343,8 +343,7 @@ class TestPatchSchedule:
         existing = make_db_record(device_id=1)
         updated = make_db_record(device_id=1, version="2.0")
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
             resp = await client.patch("/1", json={"metadata": {"version": "2.0"}})
         assert resp.status_code == 200
 
@@ -379,6 +378,62 @@ class TestDeleteSchedule:
         assert resp.status_code == 200
 
 
+# ==================== GET / ETag ====================
+
+
+class TestListEtag:
+    @pytest.mark.asyncio
+    async def test_etag_roundtrip_304(self, client):
+        with patch(f"{CRUD_PATH}.get_all_current", new_callable=AsyncMock, return_value=[]):
+            first = await client.get("/")
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+            replay = await client.get("/", headers={"If-None-Match": etag})
+        assert replay.status_code == 304
+
+
+# ==================== GET /summary ====================
+
+
+class TestGetSummary:
+    @pytest.mark.asyncio
+    async def test_summary(self, client):
+        from datetime import date, datetime
+        recs = [{
+            "id": 1, "device_id": 1, "device_name": "sensor-1", "shift_type": "day",
+            "valid_from": date(2025, 1, 1), "valid_to": None,
+            "updated_at": datetime(2025, 1, 1, 12, 0),
+        }]
+        with patch(f"{CRUD_PATH}.get_all_current_summary", new_callable=AsyncMock, return_value=recs):
+            resp = await client.get("/summary")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body[0]["deviceName"] == "sensor-1"
+        assert "schedule" not in body[0]
+
+
+# ==================== GET /export ====================
+
+
+class TestExport:
+    @pytest.mark.asyncio
+    async def test_export_streams_ndjson(self, client):
+        recs = [make_db_record(device_id=1), make_db_record(device_id=2)]
+
+        async def fake_iter(pool, prefetch=500):
+            for rec in recs:
+                yield rec
+
+        with patch(f"{CRUD_PATH}.iter_all_current", fake_iter):
+            resp = await client.get("/export")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = resp.content.strip().split(b"\n")
+        assert len(lines) == 2
+        assert orjson.loads(lines[0])["deviceId"] == 1
+        assert orjson.loads(lines[1])["deviceId"] == 2
+
+
 # ==================== GET /by-day/{day} ====================
 
 
@@ -396,6 +451,18 @@ class TestGetByDay:
         resp = await client.get("/by-day/notaday")
         assert resp.status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_device_names_by_day(self, client):
+        with patch(f"{CRUD_PATH}.get_device_names_by_day", new_callable=AsyncMock, return_value=["sensor-1"]):
+            resp = await client.get("/by-day/monday/devices")
+        assert resp.status_code == 200
+        assert resp.json() == ["sensor-1"]
+
+    @pytest.mark.asyncio
+    async def test_device_names_by_day_invalid(self, client):
+        resp = await client.get("/by-day/notaday/devices")
+        assert resp.status_code == 400
+
 
 # ==================== GET /stats/all ====================
 
@@ -403,13 +470,32 @@ class TestGetByDay:
 class TestStatsAll:
     @pytest.mark.asyncio
     async def test_stats_all(self, client):
-        recs = [make_db_record(id=1, device_id=1)]
-        with patch(f"{CRUD_PATH}.get_all_current", new_callable=AsyncMock, return_value=recs):
+        rows = [
+            {
+                "device_id": 1,
+                "today": {
+                    "workHours": {"start": "08:00", "end": "17:00"},
+                    "breaks": [{"start": "12:00", "durationMinutes": 60}],
+                },
+            }
+        ]
+        with patch(f"{CRUD_PATH}.get_stats_projection", new_callable=AsyncMock, return_value=rows):
             resp = await client.get("/stats/all")
         assert resp.status_code == 200
         body = resp.json()
         assert "requestTime" in body
         assert len(body["devices"]) == 1
+        assert body["devices"][0]["scheduleStart"] == "08:00"
+
+    @pytest.mark.asyncio
+    async def test_stats_all_inactive_today(self, client):
+        rows = [{"device_id": 2, "today": None}]
+        with patch(f"{CRUD_PATH}.get_stats_projection", new_callable=AsyncMock, return_value=rows):
+            resp = await client.get("/stats/all")
+        assert resp.status_code == 200
+        dev = resp.json()["devices"][0]
+        assert dev["usagePercentage"] == 0.0
+        assert dev["totalWorkHours"] == 0.0
 
 
 # ==================== GET /stats/{device_id} ====================
@@ -447,6 +533,20 @@ class TestSpecialDaysEndpoints:
             resp = await client.get("/special-days/999")
         assert resp.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_get_special_days_in_range(self, client):
+        sd = {"2025-12-25": {"name": "Navidad", "type": "holiday"}}
+        with patch(f"{CRUD_PATH}.get_special_days_in_range", new_callable=AsyncMock, return_value=sd):
+            resp = await client.get("/special-days/1/range?from=2025-12-01&to=2025-12-31")
+        assert resp.status_code == 200
+        assert resp.json() == sd
+
+    @pytest.mark.asyncio
+    async def test_get_special_days_in_range_not_found(self, client):
+        with patch(f"{CRUD_PATH}.get_special_days_in_range", new_callable=AsyncMock, return_value=None):
+            resp = await client.get("/special-days/999/range?from=2025-12-01&to=2025-12-31")
+        assert resp.status_code == 404
+
     @pytest.mark.asyncio
     async def test_add_special_day(self, client):
         existing = make_db_record(device_id=1)
@@ -461,14 +561,21 @@ class TestSpecialDaysEndpoints:
             }),
         )
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
             resp = await client.post(
                 "/special-days/1?date=2025-12-25",
                 json={"name": "Navidad", "type": "holiday"},
             )
         assert resp.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_add_special_day_invalid_date(self, client):
+        resp = await client.post(
+            "/special-days/1?date=bad-date",
+            json={"name": "Test", "type": "holiday"},
+        )
+        assert resp.status_code == 400
+
     @pytest.mark.asyncio
     async def test_delete_special_day(self, client):
         rec = make_db_record(
@@ -529,16 +636,30 @@ class TestEffectiveSchedule:
 class TestAuth:
     @pytest.mark.asyncio
     async def test_missing_api_key(self, mock_pool):
-        """Without the override, the real verify_api_key should reject."""
-        app.dependency_overrides.pop(verify_api_key, None)
+        """Without the X-API-Key header, the middleware should reject."""
+        app.dependency_overrides[get_db_pool] = lambda: mock_pool
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url=BASE,
+        ) as c:
+            resp = await c.get("/")
+
+        assert resp.status_code == 401
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_wrong_api_key(self, mock_pool):
         app.dependency_overrides[get_db_pool] = lambda: mock_pool
 
         async with AsyncClient(
             transport=ASGITransport(app=app),
             base_url=BASE,
+            headers={"X-API-Key": "wrong"},
         ) as c:
             resp = await c.get("/")
 
-        assert resp.status_code == 422 or resp.status_code == 401
+        assert resp.status_code == 401
 
         app.dependency_overrides.clear()
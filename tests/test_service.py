@@ -31,7 +31,7 @@ from app.schemas.schedule import (
     WorkHoursSchema,
 )
 
-from tests.conftest import make_db_record, make_extra_hours_json, make_special_days_json
+from tests.conftest import make_db_record, make_extra_hours_json, make_mock_pool, make_special_days_json
 
 
 # ==================== Helper functions ====================
@@ -219,22 +219,18 @@ class TestCalculateWorkHoursUsage:
     def test_before_work(self):
         rec = make_db_record(days=["monday"])
         # Monday at 06:00
-        now = datetime(2025, 1, 13, 6, 0, 0)
-        stats = _calculate_work_hours_usage(rec, now)
+        stats = _calculate_work_hours_usage(rec, "monday", "06:00", 6 * 60)
         assert stats["hours_used"] == pytest.approx(0.0)
         assert stats["usage_percentage"] == pytest.approx(0.0)
 
     def test_after_work(self):
         rec = make_db_record(days=["monday"])
-        now = datetime(2025, 1, 13, 18, 0, 0)
-        stats = _calculate_work_hours_usage(rec, now)
+        stats = _calculate_work_hours_usage(rec, "monday", "18:00", 18 * 60)
         assert stats["usage_percentage"] == pytest.approx(100.0)
 
     def test_non_work_day(self):
         rec = make_db_record(days=["monday"])
-        # Sunday
-        now = datetime(2025, 1, 12, 10, 0, 0)
-        stats = _calculate_work_hours_usage(rec, now)
+        stats = _calculate_work_hours_usage(rec, "sunday", "10:00", 10 * 60)
         assert stats["total_work_hours"] == pytest.approx(0.0)
 
 
@@ -247,7 +243,7 @@ CRUD_PATH = "app.services.schedule_service.schedule_crud"
 class TestScheduleServiceCreate:
     @pytest.mark.asyncio
     async def test_create_schedule(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleCreate.model_validate({
             "deviceId": 1,
             "schedule": {
@@ -272,7 +268,7 @@ class TestScheduleServiceCreate:
 class TestScheduleServiceCreateByName:
     @pytest.mark.asyncio
     async def test_create_with_device_name(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleCreate.model_validate({
             "deviceName": "1103",
             "schedule": {
@@ -295,7 +291,7 @@ class TestScheduleServiceCreateByName:
 
     @pytest.mark.asyncio
     async def test_create_with_device_name_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleCreate.model_validate({
             "deviceName": "nonexistent",
             "schedule": {
@@ -313,7 +309,7 @@ class TestScheduleServiceCreateByName:
 
     @pytest.mark.asyncio
     async def test_create_with_neither_id_nor_name(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleCreate.model_validate({
             "schedule": {
                 "monday": {
@@ -331,7 +327,7 @@ class TestScheduleServiceCreateByName:
 class TestScheduleServiceUpdate:
     @pytest.mark.asyncio
     async def test_update_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleUpdate.model_validate({
             "schedule": {
                 "monday": {
@@ -347,7 +343,7 @@ class TestScheduleServiceUpdate:
 
     @pytest.mark.asyncio
     async def test_update_success(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = ScheduleUpdate.model_validate({
             "schedule": {
                 "monday": {
@@ -361,8 +357,7 @@ class TestScheduleServiceUpdate:
         updated = make_db_record(device_id=5, days=["monday"])
 
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
             result = await ScheduleService.update_schedule(pool, 5, data)
 
         assert result.device_id == 5
@@ -371,7 +366,7 @@ class TestScheduleServiceUpdate:
 class TestScheduleServicePatch:
     @pytest.mark.asyncio
     async def test_patch_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = SchedulePatch.model_validate({"metadata": {"version": "2.0"}})
 
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=None):
@@ -380,15 +375,14 @@ class TestScheduleServicePatch:
 
     @pytest.mark.asyncio
     async def test_patch_metadata_only(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         data = SchedulePatch.model_validate({"metadata": {"version": "2.0"}})
 
         existing = make_db_record(device_id=3)
         updated = make_db_record(device_id=3, version="2.0")
 
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
             result = await ScheduleService.patch_schedule(pool, 3, data)
 
         assert result.device_id == 3
@@ -397,14 +391,14 @@ class TestScheduleServicePatch:
 class TestScheduleServiceGet:
     @pytest.mark.asyncio
     async def test_get_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=None):
             result = await ScheduleService.get_schedule(pool, 999)
         assert result is None
 
     @pytest.mark.asyncio
     async def test_get_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         rec = make_db_record(device_id=2)
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=rec):
             result = await ScheduleService.get_schedule(pool, 2)
@@ -412,7 +406,7 @@ class TestScheduleServiceGet:
 
     @pytest.mark.asyncio
     async def test_get_with_date(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         rec = make_db_record(device_id=2)
         with patch(f"{CRUD_PATH}.get_by_device_id_and_date", new_callable=AsyncMock, return_value=rec):
             result = await ScheduleService.get_schedule(pool, 2, target_date=date(2025, 6, 15))
@@ -420,7 +414,7 @@ class TestScheduleServiceGet:
 
     @pytest.mark.asyncio
     async def test_get_all(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         recs = [make_db_record(id=1, device_id=1), make_db_record(id=2, device_id=2)]
         with patch(f"{CRUD_PATH}.get_all_current", new_callable=AsyncMock, return_value=recs):
             results = await ScheduleService.get_all_schedules(pool)
@@ -428,7 +422,7 @@ class TestScheduleServiceGet:
 
     @pytest.mark.asyncio
     async def test_get_history(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         recs = [
             make_db_record(id=1, device_id=1, valid_from=date(2025, 1, 1), valid_to=date(2025, 6, 30)),
             make_db_record(id=2, device_id=1, valid_from=date(2025, 7, 1)),
@@ -441,37 +435,58 @@ class TestScheduleServiceGet:
 class TestScheduleServiceByDay:
     @pytest.mark.asyncio
     async def test_invalid_day(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with pytest.raises(ValueError):
             await ScheduleService.get_schedules_by_day(pool, "notaday")
 
     @pytest.mark.asyncio
     async def test_valid_day(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         recs = [make_db_record()]
         with patch(f"{CRUD_PATH}.get_by_day", new_callable=AsyncMock, return_value=recs):
             results = await ScheduleService.get_schedules_by_day(pool, "monday")
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_repeated_calls_hit_cache(self):
+        pool = make_mock_pool()
+        recs = [make_db_record()]
+        with patch(f"{CRUD_PATH}.get_by_day", new_callable=AsyncMock, return_value=recs) as mock_get:
+            first = await ScheduleService.get_schedules_by_day(pool, "monday")
+            second = await ScheduleService.get_schedules_by_day(pool, "monday")
+        assert first == second
+        mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(self):
+        pool = make_mock_pool()
+        recs = [make_db_record()]
+        with patch(f"{CRUD_PATH}.get_by_day", new_callable=AsyncMock, return_value=recs) as mock_get, \
+             patch(f"{CRUD_PATH}.delete_current_by_device_id", new_callable=AsyncMock, return_value=True):
+            await ScheduleService.get_schedules_by_day(pool, "monday")
+            await ScheduleService.delete_schedule(pool, 1)
+            await ScheduleService.get_schedules_by_day(pool, "monday")
+        assert mock_get.await_count == 2
+
 
 class TestScheduleServiceDelete:
     @pytest.mark.asyncio
     async def test_delete_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.delete_current_by_device_id", new_callable=AsyncMock, return_value=False):
             with pytest.raises(LookupError):
                 await ScheduleService.delete_schedule(pool, 999)
 
     @pytest.mark.asyncio
     async def test_delete_success(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.delete_current_by_device_id", new_callable=AsyncMock, return_value=True):
             result = await ScheduleService.delete_schedule(pool, 1)
         assert result is True
 
     @pytest.mark.asyncio
     async def test_delete_by_schedule_id(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.delete_by_id", new_callable=AsyncMock, return_value=True):
             result = await ScheduleService.delete_schedule(pool, 1, schedule_id=42)
         assert result is True
@@ -480,21 +495,27 @@ class TestScheduleServiceDelete:
 class TestScheduleServiceSpecialDays:
     @pytest.mark.asyncio
     async def test_get_special_days_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.get_special_days", new_callable=AsyncMock, return_value=None):
             with pytest.raises(LookupError):
                 await ScheduleService.get_special_days(pool, 999)
 
     @pytest.mark.asyncio
-    async def test_add_special_day_invalid_date(self):
-        pool = AsyncMock()
-        sd = SpecialDaySchema(name="Test", type="holiday")
+    async def test_get_special_days_in_range_invalid_date(self):
+        pool = make_mock_pool()
         with pytest.raises(ValueError):
-            await ScheduleService.add_special_day(pool, 1, "bad-date", sd)
+            await ScheduleService.get_special_days_in_range(pool, 1, "bad-date", "2025-12-31")
+
+    @pytest.mark.asyncio
+    async def test_get_special_days_in_range_not_found(self):
+        pool = make_mock_pool()
+        with patch(f"{CRUD_PATH}.get_special_days_in_range", new_callable=AsyncMock, return_value=None):
+            with pytest.raises(LookupError):
+                await ScheduleService.get_special_days_in_range(pool, 999, "2025-12-01", "2025-12-31")
 
     @pytest.mark.asyncio
     async def test_add_special_day_success(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         sd = SpecialDaySchema(name="Navidad", type="holiday")
         existing = make_db_record(device_id=1)
         updated = make_db_record(
@@ -509,49 +530,42 @@ class TestScheduleServiceSpecialDays:
         )
 
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=existing), \
-             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=True), \
-             patch(f"{CRUD_PATH}.get_by_id", new_callable=AsyncMock, return_value=updated):
-            result = await ScheduleService.add_special_day(pool, 1, "2025-12-25", sd)
+             patch(f"{CRUD_PATH}.partial_update", new_callable=AsyncMock, return_value=updated):
+            result = await ScheduleService.add_special_day(pool, 1, date(2025, 12, 25), sd)
 
         assert result.special_days is not None
 
     @pytest.mark.asyncio
     async def test_delete_special_day_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.get_current_by_device_id", new_callable=AsyncMock, return_value=None):
             with pytest.raises(LookupError):
-                await ScheduleService.delete_special_day(pool, 999, "2025-12-25")
+                await ScheduleService.delete_special_day(pool, 999, date(2025, 12, 25))
 
 
 class TestScheduleServiceEffective:
-    @pytest.mark.asyncio
-    async def test_invalid_date(self):
-        pool = AsyncMock()
-        with pytest.raises(ValueError):
-            await ScheduleService.get_effective_schedule(pool, 1, "not-a-date")
-
     @pytest.mark.asyncio
     async def test_not_found(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         with patch(f"{CRUD_PATH}.get_by_device_id_and_date", new_callable=AsyncMock, return_value=None):
             with pytest.raises(LookupError):
-                await ScheduleService.get_effective_schedule(pool, 999, "2025-01-13")
+                await ScheduleService.get_effective_schedule(pool, 999, date(2025, 1, 13))
 
     @pytest.mark.asyncio
     async def test_regular_work_day(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         rec = make_db_record(device_id=1, days=["monday"])
         with patch(f"{CRUD_PATH}.get_by_device_id_and_date", new_callable=AsyncMock, return_value=rec):
             # 2025-01-13 is a Monday
-            result = await ScheduleService.get_effective_schedule(pool, 1, "2025-01-13")
+            result = await ScheduleService.get_effective_schedule(pool, 1, date(2025, 1, 13))
         assert result is not None
         assert result.work_hours.start == "08:00"
 
     @pytest.mark.asyncio
     async def test_non_work_day(self):
-        pool = AsyncMock()
+        pool = make_mock_pool()
         rec = make_db_record(device_id=1, days=["monday"])
         with patch(f"{CRUD_PATH}.get_by_device_id_and_date", new_callable=AsyncMock, return_value=rec):
             # 2025-01-12 is a Sunday
-            result = await ScheduleService.get_effective_schedule(pool, 1, "2025-01-12")
+            result = await ScheduleService.get_effective_schedule(pool, 1, date(2025, 1, 12))
         assert result is None